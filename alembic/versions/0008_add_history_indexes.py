@@ -0,0 +1,55 @@
+"""Add composite indexes for scheduled analysis and context history
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 12:00:00.000000
+
+History endpoints filter by user_id and sort newest first. Adds composite
+(user_id, <timestamp> DESC) indexes so these queries avoid a sort over the
+user's rows, plus a partial index over in-flight scheduled analyses.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+ACTIVE_STATUSES = sa.text("status IN ('pending', 'running')")
+
+
+def upgrade() -> None:
+    """Create history and active-run indexes."""
+    
+    op.create_index(
+        'idx_scheduled_analyses_user_scheduled',
+        'scheduled_analyses',
+        ['user_id', sa.text('scheduled_at DESC')]
+    )
+    
+    # Partial index for pending/running runs (SQLite and Postgres both support WHERE)
+    op.create_index(
+        'idx_scheduled_analyses_user_active',
+        'scheduled_analyses',
+        ['user_id'],
+        postgresql_where=ACTIVE_STATUSES,
+        sqlite_where=ACTIVE_STATUSES
+    )
+    
+    op.create_index(
+        'idx_contexts_user_started',
+        'contexts',
+        ['user_id', sa.text('started_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove history and active-run indexes."""
+    
+    op.drop_index('idx_contexts_user_started', table_name='contexts')
+    op.drop_index('idx_scheduled_analyses_user_active', table_name='scheduled_analyses')
+    op.drop_index('idx_scheduled_analyses_user_scheduled', table_name='scheduled_analyses')
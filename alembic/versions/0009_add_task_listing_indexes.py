@@ -0,0 +1,55 @@
+"""Add composite indexes for task and task suggestion listing
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15 13:00:00.000000
+
+Task listings filter by user_id plus status or due date, and the
+suggestion feed filters open (pending/presented, not deleted) suggestions
+by user ordered by confidence. Adds composite and partial indexes for
+these access paths.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+OPEN_SUGGESTIONS = sa.text(
+    "is_deleted = false AND status IN ('pending', 'presented')"
+)
+
+
+def upgrade() -> None:
+    """Create task and task suggestion listing indexes."""
+    
+    op.create_index('idx_tasks_user_status', 'tasks', ['user_id', 'status'])
+    op.create_index('idx_tasks_user_due_date', 'tasks', ['user_id', 'due_date'])
+    
+    # Partial index for the open-suggestions feed, ordered by confidence
+    op.create_index(
+        'idx_task_suggestions_user_open',
+        'task_suggestions',
+        ['user_id', sa.text('confidence DESC')],
+        postgresql_where=OPEN_SUGGESTIONS,
+        sqlite_where=OPEN_SUGGESTIONS
+    )
+    op.create_index(
+        'idx_task_suggestions_user_created',
+        'task_suggestions',
+        ['user_id', sa.text('created_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove task and task suggestion listing indexes."""
+    
+    op.drop_index('idx_task_suggestions_user_created', table_name='task_suggestions')
+    op.drop_index('idx_task_suggestions_user_open', table_name='task_suggestions')
+    op.drop_index('idx_tasks_user_due_date', table_name='tasks')
+    op.drop_index('idx_tasks_user_status', table_name='tasks')
@@ -0,0 +1,62 @@
+"""Add CHECK constraints for enum-valued columns
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15 14:00:00.000000
+
+Task priority/status, suggestion priority, and the settings depth type
+and suggestion mode are stored as strings but only ever hold values from
+a closed enum. Constrain them in the database the same way
+task_suggestions.status already is.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+PRIORITIES = "('low', 'medium', 'high', 'critical')"
+
+
+def upgrade() -> None:
+    """Create enum CHECK constraints (batch mode for SQLite)."""
+    
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.create_check_constraint('check_task_priority', f"priority IN {PRIORITIES}")
+        batch_op.create_check_constraint(
+            'check_task_status',
+            "status IN ('pending', 'in_progress', 'done', 'cancelled')"
+        )
+    
+    with op.batch_alter_table('task_suggestions') as batch_op:
+        batch_op.create_check_constraint('check_suggestion_priority', f"priority IN {PRIORITIES}")
+    
+    with op.batch_alter_table('user_settings') as batch_op:
+        batch_op.create_check_constraint(
+            'check_depth_type',
+            "consciousness_check_depth_type IN "
+            "('smart', 'last_n_thoughts', 'last_n_days', 'all_thoughts')"
+        )
+        batch_op.create_check_constraint(
+            'check_task_suggestion_mode',
+            "task_suggestion_mode IN ('suggest', 'auto_create', 'disabled')"
+        )
+
+
+def downgrade() -> None:
+    """Remove enum CHECK constraints."""
+    
+    with op.batch_alter_table('user_settings') as batch_op:
+        batch_op.drop_constraint('check_task_suggestion_mode', type_='check')
+        batch_op.drop_constraint('check_depth_type', type_='check')
+    
+    with op.batch_alter_table('task_suggestions') as batch_op:
+        batch_op.drop_constraint('check_suggestion_priority', type_='check')
+    
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_constraint('check_task_status', type_='check')
+        batch_op.drop_constraint('check_task_priority', type_='check')
@@ -0,0 +1,63 @@
+"""Store thought JSON columns as JSONB with a GIN index on tags
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15 15:00:00.000000
+
+On PostgreSQL, converts the thoughts JSON columns to JSONB so tag
+filtering can use containment (tags @> '["x"]') served by a GIN index
+with the jsonb_path_ops operator class. SQLite keeps plain JSON and
+this revision is a no-op there.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = (
+    'tags',
+    'context',
+    'claude_analysis',
+    'related_thought_ids',
+    'suggested_tags',
+    'related_topics',
+)
+
+
+def upgrade() -> None:
+    """Convert thought JSON columns to JSONB and index tags (PostgreSQL only)."""
+    
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for column in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE thoughts ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+        )
+    
+    op.create_index(
+        'idx_thoughts_tags_gin',
+        'thoughts',
+        ['tags'],
+        postgresql_using='gin',
+        postgresql_ops={'tags': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Drop the tags GIN index and revert to JSON (PostgreSQL only)."""
+    
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.drop_index('idx_thoughts_tags_gin', table_name='thoughts')
+    
+    for column in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE thoughts ALTER COLUMN {column} TYPE json USING {column}::json"
+        )
@@ -0,0 +1,49 @@
+"""Add per-user timeline indexes on thoughts
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-15 16:00:00.000000
+
+Thought listings, consciousness checks and intelligence lookups filter
+by user_id and order by created_at. Scheduled checks additionally count
+only active thoughts created since the last run. Adds a composite index
+for the former and a partial index on active thoughts for the latter.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+
+ACTIVE_THOUGHTS = sa.text("status = 'active'")
+
+
+def upgrade() -> None:
+    """Create thought timeline indexes."""
+    
+    op.create_index(
+        'idx_thoughts_user_created',
+        'thoughts',
+        ['user_id', sa.text('created_at DESC')]
+    )
+    
+    # Partial index for active thoughts (SQLite and Postgres both support WHERE)
+    op.create_index(
+        'idx_thoughts_user_active',
+        'thoughts',
+        ['user_id', 'created_at'],
+        postgresql_where=ACTIVE_THOUGHTS,
+        sqlite_where=ACTIVE_THOUGHTS
+    )
+
+
+def downgrade() -> None:
+    """Remove thought timeline indexes."""
+    
+    op.drop_index('idx_thoughts_user_active', table_name='thoughts')
+    op.drop_index('idx_thoughts_user_created', table_name='thoughts')
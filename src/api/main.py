@@ -295,3 +295,8 @@ async def shutdown_event():
         print("⏰ Scheduler stopped")
     except Exception as e:
         print(f"Error stopping scheduler: {e}")
+
+    # Close pooled backend HTTP clients
+    registry = getattr(app.state, "backend_registry", None)
+    if registry is not None:
+        await registry.close_all()
@@ -9,12 +9,26 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+import orjson
 from fastapi import HTTPException, status
 from fastapi.responses import JSONResponse
 
 from ..models.base import utc_now
 
 
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson instead of the stdlib json module.
+    
+    Output is the same compact UTF-8 JSON; non-string dict keys are
+    coerced to strings as json.dumps would.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize response content to JSON bytes."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 def generate_request_id() -> str:
     """Generate unique request ID for tracking."""
     return f"req_{str(uuid4())[:8]}"
@@ -37,7 +51,7 @@ class APIResponse:
         if request_id is None:
             request_id = generate_request_id()
             
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content={
                 "success": True,
@@ -60,7 +74,7 @@ class APIResponse:
         if request_id is None:
             request_id = generate_request_id()
             
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status_code,
             content={
                 "success": False,
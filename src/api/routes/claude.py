@@ -13,7 +13,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from ...database.session import get_db
-from ...services.claude_service import ClaudeService
+from ...services.claude_service import get_claude_service
 from ...services.thought_service import ThoughtService
 from ...services.task_service import TaskService
 from ...services.claude_analysis_service import ClaudeAnalysisService
@@ -114,7 +114,7 @@ async def consciousness_check(
             )
 
         # Call Claude for analysis
-        claude = ClaudeService()
+        claude = get_claude_service()
         timeframe = "recent" if request.limit_recent <= 10 else f"last {request.limit_recent}"
         analysis_result = claude.consciousness_check(thoughts, timeframe=timeframe)
 
@@ -211,7 +211,7 @@ async def suggest_tags(
                 existing_tags.update(t.tags)
 
         # Call Claude for tag suggestions
-        claude = ClaudeService()
+        claude = get_claude_service()
         result = claude.suggest_tags(
             thought_content=thought.content,
             existing_tags=list(existing_tags) if existing_tags else None
@@ -295,7 +295,7 @@ async def extract_tasks(
             )
 
         # Call Claude for task extraction
-        claude = ClaudeService()
+        claude = get_claude_service()
         result = claude.extract_tasks(thoughts)
 
         logger.info(
@@ -380,7 +380,7 @@ async def analyze_thought(
             context_thoughts = [t for t in recent_thoughts if t.id != str(request.thought_id)][:5]
 
         # Call Claude for analysis
-        claude = ClaudeService()
+        claude = get_claude_service()
         result = claude.analyze_thought(thought, context_thoughts=context_thoughts)
 
         # Record the analysis
@@ -87,7 +87,7 @@ async def get_schedule_status(
             {
                 "id": str(a.id),
                 "timestamp": a.started_at.isoformat() if a.started_at else None,
-                "status": a.status.value if a.status else None,
+                "status": a.status,
                 "thoughts_analyzed": a.thoughts_analyzed or 0,
                 "themes": a.themes_discovered or []
             }
@@ -14,7 +14,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from ...database.session import get_db
-from ...models import TaskSuggestionAccept, TaskSuggestionResponse
+from ...models import TaskSuggestionAccept, TaskSuggestionResponse, TaskSuggestionDB
 from ...services.task_suggestion_service import TaskSuggestionService
 from ..auth import verify_api_key, get_current_user_id
 from ..responses import APIResponse, APIError
@@ -56,7 +56,10 @@ async def get_pending_suggestions(
         )
         
         return APIResponse.success(data={
-                "suggestions": [s.to_response().model_dump(mode="json") for s in suggestions],
+                "suggestions": [
+                    s.model_dump(mode="json")
+                    for s in TaskSuggestionDB.to_responses(suggestions)
+                ],
                 "count": len(suggestions)
             }
         )
@@ -100,7 +103,10 @@ async def get_suggestion_history(
         )
         
         return APIResponse.success(data={
-                "suggestions": [s.to_response().model_dump(mode="json") for s in suggestions],
+                "suggestions": [
+                    s.model_dump(mode="json")
+                    for s in TaskSuggestionDB.to_responses(suggestions)
+                ],
                 "count": len(suggestions),
                 "include_deleted": include_deleted
             }
@@ -402,7 +408,10 @@ async def get_suggestions_for_thought(
         
         return APIResponse.success(data={
                 "thought_id": str(thought_id),
-                "suggestions": [s.to_response().model_dump(mode="json") for s in suggestions],
+                "suggestions": [
+                    s.model_dump(mode="json")
+                    for s in TaskSuggestionDB.to_responses(suggestions)
+                ],
                 "count": len(suggestions)
             }
         )
@@ -17,6 +17,7 @@ from ...models import (
     TaskCreate,
     TaskUpdate,
     TaskResponse,
+    TaskDB,
     TaskStatus,
     Priority
 )
@@ -162,7 +163,9 @@ async def list_tasks(
             sort_order=sort_order
         )
         
-        task_responses = [r.to_response().model_dump(mode='json') for r in results]
+        task_responses = [
+            r.model_dump(mode='json') for r in TaskDB.to_responses(results)
+        ]
         
         return APIResponse.success(
             data={
@@ -11,6 +11,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Query, status, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from ...database.session import get_db
@@ -40,6 +41,9 @@ from ..responses import (
 
 logger = logging.getLogger(__name__)
 
+# Serializes a whole page of thoughts in one call instead of model_dump() per item
+_THOUGHT_LIST_ADAPTER = TypeAdapter(List[ThoughtResponse])
+
 router = APIRouter(
     prefix="/thoughts",
     tags=["thoughts"],
@@ -218,7 +222,9 @@ async def list_thoughts(
         
         return APIResponse.success(
             data={
-                "thoughts": [t.to_response().model_dump(mode='json') for t in results],
+                "thoughts": _THOUGHT_LIST_ADAPTER.dump_python(
+                    ThoughtDB.to_responses(results), mode='json'
+                ),
                 "pagination": {
                     "total": total,
                     "offset": offset,
@@ -0,0 +1,42 @@
+"""
+JSON codec for database JSON columns.
+
+SQLAlchemy serializes JSON columns with the stdlib json module by default.
+These helpers use orjson instead and are passed to create_engine() as
+json_serializer/json_deserializer, so every JSON column on the engine
+benefits without per-column type changes.
+"""
+
+from typing import Any, Union
+
+import orjson
+
+
+# Match stdlib json.dumps, which coerces int/float/bool dict keys to strings
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_dumps(value: Any) -> str:
+    """
+    Serialize a value for storage in a JSON column.
+    
+    Args:
+        value: JSON-compatible Python value
+        
+    Returns:
+        str: JSON text (DBAPI drivers expect str, not bytes)
+    """
+    return orjson.dumps(value, option=_DUMPS_OPTIONS).decode()
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """
+    Deserialize JSON text read from a JSON column.
+    
+    Args:
+        text: JSON text as returned by the DBAPI driver
+        
+    Returns:
+        Any: Decoded Python value
+    """
+    return orjson.loads(text)
@@ -14,6 +14,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from ..models.base import Base
+from .json_codec import json_dumps, json_loads
 
 
 # Get database URL from environment or use default SQLite file
@@ -33,6 +34,8 @@ if IS_POSTGRES:
         pool_size=5,  # Connection pool size
         max_overflow=10,  # Max overflow connections
         pool_recycle=3600,  # Recycle connections after 1 hour
+        json_serializer=json_dumps,
+        json_deserializer=json_loads,
     )
 elif IS_SQLITE:
     # SQLite-specific configuration
@@ -42,6 +45,8 @@ elif IS_SQLITE:
         connect_args=connect_args,
         echo=False,
         pool_pre_ping=True,
+        json_serializer=json_dumps,
+        json_deserializer=json_loads,
     )
 else:
     # Fallback for other databases
@@ -49,6 +54,8 @@ else:
         DATABASE_URL,
         echo=False,
         pool_pre_ping=True,
+        json_serializer=json_dumps,
+        json_deserializer=json_loads,
     )
 
 
@@ -3,6 +3,11 @@ Base models for the Personal AI Assistant.
 
 Provides common functionality for all Pydantic and SQLAlchemy models including
 UUID generation, UTC timestamps, and shared validation logic.
+
+ORM models convert rows to API responses with to_response() and, for list
+endpoints, a to_responses() batch classmethod. Database rows are trusted,
+so these build responses with model_construct() and only coerce what the
+column type doesn't already match (UUID strings, enum values).
 """
 
 from datetime import datetime, timezone
@@ -10,7 +15,8 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel as PydanticBaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import Column, DateTime, String, TypeDecorator
+from sqlalchemy import Column, DateTime, JSON, String, TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 
 
@@ -46,6 +52,11 @@ class TZDateTime(TypeDecorator):
         return value
 
 
+# JSON column type that is binary JSONB on PostgreSQL (supports GIN indexes
+# and @> containment) and plain JSON everywhere else
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
 def utc_now() -> datetime:
     """
     Get current UTC timestamp with timezone awareness.
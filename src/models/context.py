@@ -10,13 +10,16 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import Field
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from pydantic import ConfigDict, Field
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 
 from .base import BaseRequestModel, BaseDBModel, TZDateTime
 from .enums import TimeOfDay, EnergyLevel, FocusState
 
 
+_CTX_REPR = "<ContextDB(session_id=%s, user_id=%s, activity=%r, thought_count=%s)>"
+
+
 class ContextCreate(BaseRequestModel):
     """
     Model for creating a new context session.
@@ -80,8 +83,11 @@ class ContextResponse(ContextCreate):
     
     Extends ContextCreate with additional tracked fields like
     user_id, timestamps, and thought count for the session.
+    Enum fields are stored as their raw string values.
     """
     
+    model_config = ConfigDict(use_enum_values=True)
+    
     user_id: UUID = Field(..., description="Owner of this context")
     started_at: datetime = Field(..., description="When context began")
     thought_count: int = Field(
@@ -118,27 +124,29 @@ class ContextDB(BaseDBModel):
     notes = Column(Text, nullable=True)
     ended_at = Column(TZDateTime, nullable=True)
     
+    # Index for listing a user's sessions newest first
+    __table_args__ = (
+        Index('idx_contexts_user_started', user_id, started_at.desc()),
+    )
+    
     def __repr__(self) -> str:
         """String representation for debugging."""
-        return (
-            f"<ContextDB(session_id={self.id}, "
-            f"user_id={self.user_id}, "
-            f"activity='{self.current_activity}', "
-            f"thought_count={self.thought_count})>"
+        return _CTX_REPR % (
+            self.id, self.user_id, self.current_activity, self.thought_count
         )
     
     def to_response(self) -> ContextResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
-        return ContextResponse(
+        return ContextResponse.model_construct(
             session_id=self.id,
-            user_id=self.user_id,
+            user_id=UUID(self.user_id),
             started_at=self.started_at,
             current_activity=self.current_activity,
             active_app=self.active_app,
             location=self.location,
-            time_of_day=TimeOfDay(self.time_of_day) if self.time_of_day else None,
-            energy_level=EnergyLevel(self.energy_level) if self.energy_level else None,
-            focus_state=FocusState(self.focus_state) if self.focus_state else None,
+            time_of_day=self.time_of_day,
+            energy_level=self.energy_level,
+            focus_state=self.focus_state,
             thought_count=self.thought_count,
             notes=self.notes,
             ended_at=self.ended_at
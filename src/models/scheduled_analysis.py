@@ -6,17 +6,20 @@ results, and performance metrics. Provides audit trail for debugging.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from pydantic import Field
-from sqlalchemy import Column, String, Integer, Text, ForeignKey
+from pydantic import ConfigDict, Field
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from .base import BaseTimestampModel, BaseRequestModel, TZDateTime, utc_now, Base
 from .enums import ScheduledAnalysisStatus
 
 
+_SCHED_REPR = "<ScheduledAnalysisDB(id=%s, user_id=%s, status=%s, scheduled_at=%s)>"
+
+
 class ScheduledAnalysisCreate(BaseRequestModel):
     """
     Model for creating a scheduled analysis record.
@@ -32,13 +35,34 @@ class ScheduledAnalysisCreate(BaseRequestModel):
     )
 
 
+_SCHEDULED_ANALYSIS_EXAMPLE = {
+    "id": "abc123",
+    "user_id": "550e8400-e29b-41d4-a716-446655440000",
+    "scheduled_at": "2025-12-26T14:00:00Z",
+    "executed_at": "2025-12-26T14:00:01Z",
+    "completed_at": "2025-12-26T14:00:15Z",
+    "status": "completed",
+    "thoughts_since_last_check": 3,
+    "thoughts_analyzed_count": 17,
+    "analysis_duration_ms": 14250,
+    "analysis_result_id": "result-xyz",
+    "triggered_by": "scheduler"
+}
+
+
 class ScheduledAnalysisResponse(BaseTimestampModel):
     """
     Complete scheduled analysis model returned by API.
     
     Includes execution details, results, and performance metrics.
+    Enum fields are stored as their raw string values.
     """
     
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={"example": _SCHEDULED_ANALYSIS_EXAMPLE},
+    )
+    
     user_id: UUID = Field(..., description="User this analysis belongs to")
     scheduled_at: datetime = Field(..., description="When this was scheduled to run")
     executed_at: Optional[datetime] = Field(None, description="When execution started")
@@ -77,24 +101,6 @@ class ScheduledAnalysisResponse(BaseTimestampModel):
         ...,
         description="What triggered this: scheduler, manual, api"
     )
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
-            "example": {
-                "id": "abc123",
-                "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                "scheduled_at": "2025-12-26T14:00:00Z",
-                "executed_at": "2025-12-26T14:00:01Z",
-                "completed_at": "2025-12-26T14:00:15Z",
-                "status": "completed",
-                "thoughts_since_last_check": 3,
-                "thoughts_analyzed_count": 17,
-                "analysis_duration_ms": 14250,
-                "analysis_result_id": "result-xyz",
-                "triggered_by": "scheduler"
-            }
-        }
 
 
 class ScheduledAnalysisHistoryResponse(BaseRequestModel):
@@ -156,36 +162,63 @@ class ScheduledAnalysisDB(Base):
     # Metadata (only created_at, no updated_at since this is append-only)
     created_at = Column(TZDateTime, nullable=False, default=utc_now)
     
+    # Indexes for history listing (newest first) and status filtering.
+    # The partial index keeps lookups of in-flight runs small.
+    __table_args__ = (
+        Index(
+            'idx_scheduled_analyses_user_scheduled',
+            user_id,
+            scheduled_at.desc()
+        ),
+        Index('idx_scheduled_analyses_user_status', user_id, status),
+        Index(
+            'idx_scheduled_analyses_user_active',
+            user_id,
+            postgresql_where=status.in_(('pending', 'running')),
+            sqlite_where=status.in_(('pending', 'running'))
+        ),
+    )
+    
     # Relationships
     user = relationship("UserDB", back_populates="scheduled_analyses")
     analysis_result = relationship("ClaudeAnalysisDB")
     
     def __repr__(self) -> str:
         """String representation for debugging."""
-        return (
-            f"<ScheduledAnalysisDB("
-            f"id={self.id}, "
-            f"user_id={self.user_id}, "
-            f"status={self.status}, "
-            f"scheduled_at={self.scheduled_at})>"
+        return _SCHED_REPR % (
+            self.id, self.user_id, self.status, self.scheduled_at
         )
     
     def to_response(self) -> ScheduledAnalysisResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
-        return ScheduledAnalysisResponse(
-            id=self.id,
-            user_id=self.user_id,
-            scheduled_at=self.scheduled_at,
-            executed_at=self.executed_at,
-            completed_at=self.completed_at,
-            status=ScheduledAnalysisStatus(self.status),
-            skip_reason=self.skip_reason,
-            thoughts_since_last_check=self.thoughts_since_last_check,
-            thoughts_analyzed_count=self.thoughts_analyzed_count,
-            analysis_duration_ms=self.analysis_duration_ms,
-            analysis_result_id=self.analysis_result_id,
-            error_message=self.error_message,
-            triggered_by=self.triggered_by,
-            created_at=self.created_at,
-            updated_at=self.created_at  # Use created_at as updated_at for this model
-        )
+        return self.to_responses((self,))[0]
+    
+    @classmethod
+    def to_responses(
+        cls,
+        rows: Sequence["ScheduledAnalysisDB"]
+    ) -> list[ScheduledAnalysisResponse]:
+        """Convert many rows to Pydantic response models in one pass."""
+        construct = ScheduledAnalysisResponse.model_construct
+        return [
+            construct(
+                id=UUID(row.id),
+                user_id=UUID(row.user_id),
+                scheduled_at=row.scheduled_at,
+                executed_at=row.executed_at,
+                completed_at=row.completed_at,
+                status=row.status,
+                skip_reason=row.skip_reason,
+                thoughts_since_last_check=row.thoughts_since_last_check,
+                thoughts_analyzed_count=row.thoughts_analyzed_count,
+                analysis_duration_ms=row.analysis_duration_ms,
+                analysis_result_id=(
+                    UUID(row.analysis_result_id) if row.analysis_result_id else None
+                ),
+                error_message=row.error_message,
+                triggered_by=row.triggered_by,
+                created_at=row.created_at,
+                updated_at=row.created_at  # Use created_at as updated_at for this model
+            )
+            for row in rows
+        ]
@@ -5,18 +5,24 @@ Defines user-configurable settings for consciousness checks, auto-analysis,
 and backend preferences. Supports multi-user architecture with RBAC foundation.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey
+from pydantic import ConfigDict, Field
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, CheckConstraint, true
 from sqlalchemy.orm import relationship
 
 from .base import BaseTimestampModel, BaseRequestModel, BaseDBModel, TZDateTime, utc_now
 from .enums import SettingsDepthType, TaskSuggestionMode
 
 
+# Value -> member lookups used when converting database rows
+_DEPTH_TYPE_BY_VALUE = {m.value: m for m in SettingsDepthType}
+_SUGGESTION_MODE_BY_VALUE = {m.value: m for m in TaskSuggestionMode}
+
+
 class UserSettingsCreate(BaseRequestModel):
     """
     Model for creating user settings.
@@ -25,6 +31,8 @@ class UserSettingsCreate(BaseRequestModel):
     All fields have sensible defaults for ADHD-friendly operation.
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     # Consciousness Check Settings
     consciousness_check_enabled: bool = Field(
         default=True,
@@ -90,6 +98,8 @@ class UserSettingsUpdate(BaseRequestModel):
         ... )
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     consciousness_check_enabled: Optional[bool] = None
     consciousness_check_interval_minutes: Optional[int] = Field(
         default=None,
@@ -106,14 +116,24 @@ class UserSettingsUpdate(BaseRequestModel):
     
     primary_backend: Optional[str] = None
     secondary_backend: Optional[str] = None
-    
-    @field_validator('consciousness_check_interval_minutes')
-    @classmethod
-    def validate_interval(cls, v: Optional[int]) -> Optional[int]:
-        """Ensure interval is within valid range."""
-        if v is not None and (v < 1 or v > 1440):
-            raise ValueError('Interval must be between 1 and 1440 minutes (24 hours)')
-        return v
+
+
+_USER_SETTINGS_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "user_id": "550e8400-e29b-41d4-a716-446655440001",
+    "consciousness_check_enabled": True,
+    "consciousness_check_interval_minutes": 30,
+    "consciousness_check_depth_type": "smart",
+    "consciousness_check_depth_value": 7,
+    "consciousness_check_min_thoughts": 10,
+    "auto_tagging_enabled": True,
+    "auto_task_creation_enabled": True,
+    "task_suggestion_mode": "suggest",
+    "primary_backend": None,
+    "secondary_backend": None,
+    "created_at": "2025-12-26T10:00:00Z",
+    "updated_at": "2025-12-26T10:00:00Z"
+}
 
 
 class UserSettingsResponse(BaseTimestampModel):
@@ -123,6 +143,11 @@ class UserSettingsResponse(BaseTimestampModel):
     Includes all configuration options with current values.
     """
     
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _USER_SETTINGS_EXAMPLE},
+    )
+    
     user_id: UUID = Field(..., description="ID of the user these settings belong to")
     
     # Consciousness Check Settings
@@ -170,30 +195,10 @@ class UserSettingsResponse(BaseTimestampModel):
         None,
         description="Override secondary AI backend"
     )
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
-            "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "user_id": "550e8400-e29b-41d4-a716-446655440001",
-                "consciousness_check_enabled": True,
-                "consciousness_check_interval_minutes": 30,
-                "consciousness_check_depth_type": "smart",
-                "consciousness_check_depth_value": 7,
-                "consciousness_check_min_thoughts": 10,
-                "auto_tagging_enabled": True,
-                "auto_task_creation_enabled": True,
-                "task_suggestion_mode": "suggest",
-                "primary_backend": None,
-                "secondary_backend": None,
-                "created_at": "2025-12-26T10:00:00Z",
-                "updated_at": "2025-12-26T10:00:00Z"
-            }
-        }
 
 
-class AnalysisDepthConfig(BaseRequestModel):
+@dataclass(slots=True, frozen=True)
+class AnalysisDepthConfig:
     """
     Computed analysis depth configuration.
     
@@ -201,24 +206,21 @@ class AnalysisDepthConfig(BaseRequestModel):
     resolving the depth_type into actual query parameters.
     
     For 'smart' mode: returns max(last N days, min M thoughts)
+    
+    This is an internal value built by services, never parsed from
+    request input, so it is a plain dataclass rather than a Pydantic model.
+    
+    Attributes:
+        depth_type: Original depth type from settings
+        since_date: Analyze thoughts created after this date
+        max_thoughts: Maximum number of thoughts to analyze
+        min_thoughts: Minimum thoughts to ensure (for smart mode)
     """
     
-    depth_type: SettingsDepthType = Field(
-        ...,
-        description="Original depth type from settings"
-    )
-    since_date: Optional[datetime] = Field(
-        None,
-        description="Analyze thoughts created after this date"
-    )
-    max_thoughts: Optional[int] = Field(
-        None,
-        description="Maximum number of thoughts to analyze"
-    )
-    min_thoughts: Optional[int] = Field(
-        None,
-        description="Minimum thoughts to ensure (for smart mode)"
-    )
+    depth_type: SettingsDepthType
+    since_date: Optional[datetime] = None
+    max_thoughts: Optional[int] = None
+    min_thoughts: Optional[int] = None
 
 
 class UserSettingsDB(BaseDBModel):
@@ -238,21 +240,33 @@ class UserSettingsDB(BaseDBModel):
     )
     
     # Consciousness Check Settings
-    consciousness_check_enabled = Column(Boolean, nullable=False, default=True)
-    consciousness_check_interval_minutes = Column(Integer, nullable=False, default=30)
+    consciousness_check_enabled = Column(Boolean, nullable=False, default=True, server_default=true())
+    consciousness_check_interval_minutes = Column(Integer, nullable=False, default=30, server_default='30')
     consciousness_check_depth_type = Column(String(20), nullable=False, default='smart')
-    consciousness_check_depth_value = Column(Integer, nullable=False, default=7)
-    consciousness_check_min_thoughts = Column(Integer, nullable=False, default=10)
+    consciousness_check_depth_value = Column(Integer, nullable=False, default=7, server_default='7')
+    consciousness_check_min_thoughts = Column(Integer, nullable=False, default=10, server_default='10')
     
     # Auto-Analysis Settings
-    auto_tagging_enabled = Column(Boolean, nullable=False, default=True)
-    auto_task_creation_enabled = Column(Boolean, nullable=False, default=True)
+    auto_tagging_enabled = Column(Boolean, nullable=False, default=True, server_default=true())
+    auto_task_creation_enabled = Column(Boolean, nullable=False, default=True, server_default=true())
     task_suggestion_mode = Column(String(20), nullable=False, default='suggest')
     
     # Backend Override Settings
     primary_backend = Column(String(50), nullable=True)
     secondary_backend = Column(String(50), nullable=True)
     
+    __table_args__ = (
+        CheckConstraint(
+            "consciousness_check_depth_type IN "
+            "('smart', 'last_n_thoughts', 'last_n_days', 'all_thoughts')",
+            name='check_depth_type'
+        ),
+        CheckConstraint(
+            "task_suggestion_mode IN ('suggest', 'auto_create', 'disabled')",
+            name='check_task_suggestion_mode'
+        ),
+    )
+    
     # Relationship to user
     user = relationship("UserDB", back_populates="settings")
     
@@ -267,17 +281,17 @@ class UserSettingsDB(BaseDBModel):
     
     def to_response(self) -> UserSettingsResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
-        return UserSettingsResponse(
-            id=self.id,
-            user_id=self.user_id,
+        return UserSettingsResponse.model_construct(
+            id=UUID(self.id),
+            user_id=UUID(self.user_id),
             consciousness_check_enabled=self.consciousness_check_enabled,
             consciousness_check_interval_minutes=self.consciousness_check_interval_minutes,
-            consciousness_check_depth_type=SettingsDepthType(self.consciousness_check_depth_type),
+            consciousness_check_depth_type=_DEPTH_TYPE_BY_VALUE[self.consciousness_check_depth_type],
             consciousness_check_depth_value=self.consciousness_check_depth_value,
             consciousness_check_min_thoughts=self.consciousness_check_min_thoughts,
             auto_tagging_enabled=self.auto_tagging_enabled,
             auto_task_creation_enabled=self.auto_task_creation_enabled,
-            task_suggestion_mode=TaskSuggestionMode(self.task_suggestion_mode),
+            task_suggestion_mode=_SUGGESTION_MODE_BY_VALUE[self.task_suggestion_mode],
             primary_backend=self.primary_backend,
             secondary_backend=self.secondary_backend,
             created_at=self.created_at,
@@ -6,11 +6,13 @@ persistence. Tasks are actionable items derived from thoughts.
 """
 
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from pydantic import Field, field_validator
-from sqlalchemy import Column, Date, Integer, JSON, String, Text, ForeignKey, DateTime
+from pydantic import AfterValidator, ConfigDict, Field
+from sqlalchemy import (
+    Column, Date, Integer, JSON, String, Text, ForeignKey, DateTime, Index, CheckConstraint
+)
 from sqlalchemy.orm import relationship
 
 from .base import (
@@ -23,6 +25,40 @@ from .base import (
 from .enums import TaskStatus, Priority
 
 
+# Value -> member lookups used when converting database rows
+_PRIORITY_BY_VALUE = {m.value: m for m in Priority}
+_STATUS_BY_VALUE = {m.value: m for m in TaskStatus}
+
+
+def _validate_title(v: str) -> str:
+    """Validate title is not empty and within length limits."""
+    v = v.strip()
+    if not v:
+        raise ValueError("Title cannot be empty or whitespace-only")
+    if len(v) > 200:
+        raise ValueError(f"Title exceeds 200 characters (got {len(v)})")
+    return v
+
+
+def _validate_description(v: str) -> str:
+    """Validate description content and length."""
+    return validate_content_length(v, max_length=5000)
+
+
+# Shared field types so TaskCreate and TaskUpdate reuse one validator each.
+# Length constraints run before the validator, matching field constraints.
+TaskTitle = Annotated[
+    str,
+    Field(min_length=1, max_length=200),
+    AfterValidator(_validate_title)
+]
+TaskDescription = Annotated[
+    str,
+    Field(max_length=5000),
+    AfterValidator(_validate_description)
+]
+
+
 class TaskCreate(BaseRequestModel):
     """
     Model for creating a new task via API.
@@ -39,17 +75,12 @@ class TaskCreate(BaseRequestModel):
         ...     due_date=date(2025, 12, 17)
         ... )
     """
-
     
-    title: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        description="Short task description"
-    )
-    description: Optional[str] = Field(
+    model_config = ConfigDict(defer_build=True)
+    
+    title: TaskTitle = Field(..., description="Short task description")
+    description: Optional[TaskDescription] = Field(
         default=None,
-        max_length=5000,
         description="Detailed task description"
     )
     source_thought_id: Optional[UUID] = Field(
@@ -69,26 +100,6 @@ class TaskCreate(BaseRequestModel):
         gt=0,
         description="Estimated time to complete (minutes)"
     )
-    
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate title is not empty and within length limits."""
-        v = v.strip()
-        if not v:
-            raise ValueError("Title cannot be empty or whitespace-only")
-        if len(v) > 200:
-            raise ValueError(f"Title exceeds 200 characters (got {len(v)})")
-        return v
-
-    
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: Optional[str]) -> Optional[str]:
-        """Validate description if provided."""
-        if v is not None:
-            return validate_content_length(v, max_length=5000)
-        return v
 
 
 class TaskUpdate(BaseRequestModel):
@@ -98,34 +109,16 @@ class TaskUpdate(BaseRequestModel):
     All fields are optional - only provide fields you want to update.
     The updated_at timestamp is automatically set on update.
     """
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=5000)
+    
+    model_config = ConfigDict(defer_build=True)
+    
+    title: Optional[TaskTitle] = None
+    description: Optional[TaskDescription] = None
     priority: Optional[Priority] = None
     status: Optional[TaskStatus] = None
     due_date: Optional[date] = None
     estimated_effort_minutes: Optional[int] = Field(None, gt=0)
 
-    
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, v: Optional[str]) -> Optional[str]:
-        """Validate title if provided."""
-        if v is not None:
-            v = v.strip()
-            if not v:
-                raise ValueError("Title cannot be empty or whitespace-only")
-            if len(v) > 200:
-                raise ValueError(f"Title exceeds 200 characters (got {len(v)})")
-        return v
-    
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: Optional[str]) -> Optional[str]:
-        """Validate description if provided."""
-        if v is not None:
-            return validate_content_length(v, max_length=5000)
-        return v
-
 
 class TaskResponse(BaseTimestampModel):
     """
@@ -144,7 +137,8 @@ class TaskResponse(BaseTimestampModel):
         ...     created_at=datetime.now(timezone.utc)
         ... )
     """
-
+    
+    model_config = ConfigDict(defer_build=True)
     
     user_id: UUID = Field(..., description="Owner of this task")
     source_thought_id: Optional[UUID] = Field(
@@ -223,6 +217,20 @@ class TaskDB(BaseDBModel):
     linked_reminders = Column(JSON, nullable=False, default=list)
     subtasks = Column(JSON, nullable=False, default=list)
     
+    # Indexes for per-user task listing filtered by status or due date
+    __table_args__ = (
+        Index('idx_tasks_user_status', user_id, status),
+        Index('idx_tasks_user_due_date', user_id, due_date),
+        CheckConstraint(
+            "priority IN ('low', 'medium', 'high', 'critical')",
+            name='check_task_priority'
+        ),
+        CheckConstraint(
+            "status IN ('pending', 'in_progress', 'done', 'cancelled')",
+            name='check_task_status'
+        ),
+    )
+    
     # Relationships
     # Note: This links Task to the Thought it was created FROM
     # Different from ThoughtDB.task which links Thought TO a task
@@ -249,19 +257,32 @@ class TaskDB(BaseDBModel):
     
     def to_response(self) -> TaskResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
-        return TaskResponse(
-            id=self.id,
-            user_id=self.user_id,
-            source_thought_id=self.source_thought_id,
-            title=self.title,
-            description=self.description,
-            priority=Priority(self.priority),
-            status=TaskStatus(self.status),
-            due_date=self.due_date,
-            estimated_effort_minutes=self.estimated_effort_minutes,
-            completed_at=self.completed_at,
-            linked_reminders=self.linked_reminders or [],
-            subtasks=self.subtasks or [],
-            created_at=self.created_at,
-            updated_at=self.updated_at
-        )
+        return self.to_responses((self,))[0]
+    
+    @classmethod
+    def to_responses(cls, rows: Sequence["TaskDB"]) -> list[TaskResponse]:
+        """Convert many rows to Pydantic response models in one pass."""
+        construct = TaskResponse.model_construct
+        priority_by_value = _PRIORITY_BY_VALUE
+        status_by_value = _STATUS_BY_VALUE
+        return [
+            construct(
+                id=UUID(row.id),
+                user_id=UUID(row.user_id),
+                source_thought_id=(
+                    UUID(row.source_thought_id) if row.source_thought_id else None
+                ),
+                title=row.title,
+                description=row.description,
+                priority=priority_by_value[row.priority],
+                status=status_by_value[row.status],
+                due_date=row.due_date,
+                estimated_effort_minutes=row.estimated_effort_minutes,
+                completed_at=row.completed_at,
+                linked_reminders=row.linked_reminders or [],
+                subtasks=row.subtasks or [],
+                created_at=row.created_at,
+                updated_at=row.updated_at
+            )
+            for row in rows
+        ]
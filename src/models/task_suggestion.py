@@ -7,11 +7,13 @@ their mind and restore deleted suggestions.
 """
 
 from datetime import datetime, date
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from pydantic import Field, field_validator
-from sqlalchemy import Column, String, Text, Boolean, Integer, Float, Date, ForeignKey
+from pydantic import ConfigDict, Field, field_validator
+from sqlalchemy import (
+    Column, String, Text, Boolean, Integer, Float, Date, ForeignKey, Index, CheckConstraint, desc, false
+)
 from sqlalchemy.orm import relationship
 
 from .base import (
@@ -24,6 +26,12 @@ from .base import (
 from .enums import Priority, TaskSuggestionStatus, TaskSuggestionUserAction
 
 
+# Value -> member lookups used when converting database rows
+_PRIORITY_BY_VALUE = {m.value: m for m in Priority}
+_STATUS_BY_VALUE = {m.value: m for m in TaskSuggestionStatus}
+_USER_ACTION_BY_VALUE = {m.value: m for m in TaskSuggestionUserAction}
+
+
 class SuggestedTag(BaseRequestModel):
     """
     A suggested tag with confidence score.
@@ -68,6 +76,8 @@ class TaskSuggestionCreate(BaseRequestModel):
     Typically created by ThoughtIntelligenceService from analysis.
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     source_thought_id: UUID = Field(..., description="ID of the thought that spawned this")
     title: str = Field(..., min_length=1, max_length=200, description="Suggested task title")
     description: Optional[str] = Field(default=None, max_length=5000)
@@ -85,6 +95,8 @@ class TaskSuggestionAccept(BaseRequestModel):
     Allows user to tweak the suggested task before creation.
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     title: Optional[str] = Field(default=None, min_length=1, max_length=200)
     description: Optional[str] = Field(default=None, max_length=5000)
     priority: Optional[Priority] = None
@@ -92,6 +104,22 @@ class TaskSuggestionAccept(BaseRequestModel):
     due_date: Optional[date] = Field(default=None, description="Actual due date for task")
 
 
+_TASK_SUGGESTION_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "user_id": "550e8400-e29b-41d4-a716-446655440001",
+    "source_thought_id": "550e8400-e29b-41d4-a716-446655440002",
+    "title": "Improve email spam analyzer",
+    "description": "Add regex patterns for unsubscribe URLs",
+    "priority": "medium",
+    "confidence": 0.85,
+    "reasoning": "Contains actionable verb 'improve' and specific technical details",
+    "status": "pending",
+    "is_deleted": False,
+    "created_at": "2025-12-26T14:00:00Z",
+    "updated_at": "2025-12-26T14:00:00Z"
+}
+
+
 class TaskSuggestionResponse(BaseTimestampModel):
     """
     Complete task suggestion returned by API.
@@ -99,6 +127,11 @@ class TaskSuggestionResponse(BaseTimestampModel):
     Includes suggestion details, confidence, reasoning, and user action tracking.
     """
     
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={"example": _TASK_SUGGESTION_EXAMPLE},
+    )
+    
     user_id: UUID = Field(..., description="Owner of this suggestion")
     source_thought_id: Optional[UUID] = Field(default=None, description="Thought that spawned this (optional for consciousness check generated suggestions)")
     
@@ -123,25 +156,6 @@ class TaskSuggestionResponse(BaseTimestampModel):
     is_deleted: bool = Field(default=False)
     deleted_at: Optional[datetime] = Field(default=None)
     deletion_reason: Optional[str] = Field(default=None)
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
-            "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "user_id": "550e8400-e29b-41d4-a716-446655440001",
-                "source_thought_id": "550e8400-e29b-41d4-a716-446655440002",
-                "title": "Improve email spam analyzer",
-                "description": "Add regex patterns for unsubscribe URLs",
-                "priority": "medium",
-                "confidence": 0.85,
-                "reasoning": "Contains actionable verb 'improve' and specific technical details",
-                "status": "pending",
-                "is_deleted": False,
-                "created_at": "2025-12-26T14:00:00Z",
-                "updated_at": "2025-12-26T14:00:00Z"
-            }
-        }
 
 
 class TaskSuggestionDB(BaseDBModel):
@@ -191,10 +205,39 @@ class TaskSuggestionDB(BaseDBModel):
     )
     
     # Soft delete
-    is_deleted = Column(Boolean, nullable=False, default=False)
+    is_deleted = Column(Boolean, nullable=False, default=False, server_default=false())
     deleted_at = Column(TZDateTime, nullable=True)
     deletion_reason = Column(String(100), nullable=True)
     
+    # Indexes for the open-suggestions feed (by confidence) and history
+    # listing (newest first). Soft-deleted and acted-on rows are excluded
+    # from the partial index so it only holds what the feed can return.
+    __table_args__ = (
+        Index('idx_task_suggestions_user_status', user_id, status),
+        Index(
+            'idx_task_suggestions_user_open',
+            user_id,
+            confidence.desc(),
+            postgresql_where=(is_deleted == false()) & status.in_(('pending', 'presented')),
+            sqlite_where=(is_deleted == false()) & status.in_(('pending', 'presented'))
+        ),
+        Index('idx_task_suggestions_user_created', user_id, desc('created_at')),
+        CheckConstraint('confidence >= 0.0 AND confidence <= 1.0', name='check_confidence_range'),
+        CheckConstraint(
+            "priority IN ('low', 'medium', 'high', 'critical')",
+            name='check_suggestion_priority'
+        ),
+        CheckConstraint(
+            "status IN ('pending', 'presented', 'accepted', 'rejected', 'expired')",
+            name='check_suggestion_status'
+        ),
+        CheckConstraint(
+            "user_action IS NULL OR user_action IN "
+            "('accepted', 'rejected', 'modified', 'ignored', 'deleted_then_recreated')",
+            name='check_user_action'
+        ),
+    )
+    
     # Relationships
     user = relationship("UserDB", back_populates="task_suggestions")
     source_thought = relationship("ThoughtDB", back_populates="task_suggestions")
@@ -212,24 +255,43 @@ class TaskSuggestionDB(BaseDBModel):
     
     def to_response(self) -> TaskSuggestionResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
-        return TaskSuggestionResponse(
-            id=self.id,
-            user_id=self.user_id,
-            source_thought_id=self.source_thought_id,
-            title=self.title,
-            description=self.description,
-            priority=Priority(self.priority),
-            estimated_effort_minutes=self.estimated_effort_minutes,
-            due_date_hint=self.due_date_hint,
-            confidence=self.confidence,
-            reasoning=self.reasoning,
-            status=TaskSuggestionStatus(self.status),
-            user_action=TaskSuggestionUserAction(self.user_action) if self.user_action else None,
-            user_action_at=self.user_action_at,
-            created_task_id=self.created_task_id,
-            is_deleted=self.is_deleted,
-            deleted_at=self.deleted_at,
-            deletion_reason=self.deletion_reason,
-            created_at=self.created_at,
-            updated_at=self.updated_at,
-        )
+        return self.to_responses((self,))[0]
+    
+    @classmethod
+    def to_responses(
+        cls,
+        rows: Sequence["TaskSuggestionDB"]
+    ) -> list[TaskSuggestionResponse]:
+        """Convert many rows to Pydantic response models in one pass."""
+        construct = TaskSuggestionResponse.model_construct
+        priority_by_value = _PRIORITY_BY_VALUE
+        status_by_value = _STATUS_BY_VALUE
+        user_action_by_value = _USER_ACTION_BY_VALUE
+        return [
+            construct(
+                id=UUID(row.id),
+                user_id=UUID(row.user_id),
+                source_thought_id=(
+                    UUID(row.source_thought_id) if row.source_thought_id else None
+                ),
+                title=row.title,
+                description=row.description,
+                priority=priority_by_value[row.priority],
+                estimated_effort_minutes=row.estimated_effort_minutes,
+                due_date_hint=row.due_date_hint,
+                confidence=row.confidence,
+                reasoning=row.reasoning,
+                status=status_by_value[row.status],
+                user_action=user_action_by_value.get(row.user_action),
+                user_action_at=row.user_action_at,
+                created_task_id=(
+                    UUID(row.created_task_id) if row.created_task_id else None
+                ),
+                is_deleted=row.is_deleted,
+                deleted_at=row.deleted_at,
+                deletion_reason=row.deletion_reason,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in rows
+        ]
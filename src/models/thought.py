@@ -9,23 +9,70 @@ auto-tagging, and actionability detection.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from pydantic import Field, field_validator
-from sqlalchemy import Column, JSON, String, Text, Boolean, Float, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, Float, Integer, ForeignKey, Index, desc
 from sqlalchemy.orm import relationship
 
 from .base import (
     BaseTimestampModel,
     BaseRequestModel,
     BaseDBModel,
+    JSONDocument,
     TZDateTime,
     validate_content_length
 )
 from .enums import ThoughtStatus, ThoughtType, EmotionalTone, Urgency
 
 
+# Value -> member lookups used when converting database rows
+_STATUS_BY_VALUE = {m.value: m for m in ThoughtStatus}
+_THOUGHT_TYPE_BY_VALUE = {m.value: m for m in ThoughtType}
+_EMOTIONAL_TONE_BY_VALUE = {m.value: m for m in EmotionalTone}
+_URGENCY_BY_VALUE = {m.value: m for m in Urgency}
+
+# Separators allowed in tags, stripped in one pass before the isalnum() check
+_TAG_SEPARATORS = str.maketrans('', '', '-_')
+
+
+def _validate_tags(v: List[str]) -> List[str]:
+    """
+    Validate tags format and constraints.
+    
+    Shared by ThoughtCreate and ThoughtUpdate.
+    
+    Rules:
+    - Max 5 tags
+    - Each tag 1-50 characters
+    - Lowercase alphanumeric + hyphens only
+    - No duplicates
+    """
+    if len(v) > 5:
+        raise ValueError("Maximum 5 tags allowed")
+    
+    validated_tags = []
+    seen = set()
+    for tag in v:
+        tag = tag.strip().lower()
+        if not tag:
+            continue  # Skip empty tags
+        if len(tag) > 50:
+            raise ValueError(f"Tag '{tag}' exceeds 50 character limit")
+        if not tag.translate(_TAG_SEPARATORS).isalnum():
+            raise ValueError(
+                f"Tag '{tag}' contains invalid characters. "
+                "Use only lowercase alphanumeric and hyphens."
+            )
+        if tag in seen:
+            raise ValueError("Duplicate tags not allowed")
+        seen.add(tag)
+        validated_tags.append(tag)
+    
+    return validated_tags
+
+
 class ThoughtCreate(BaseRequestModel):
     """
     Model for creating a new thought via API.
@@ -67,37 +114,8 @@ class ThoughtCreate(BaseRequestModel):
     @field_validator('tags')
     @classmethod
     def validate_tags(cls, v: List[str]) -> List[str]:
-        """
-        Validate tags format and constraints.
-        
-        Rules:
-        - Max 5 tags
-        - Each tag 1-50 characters
-        - Lowercase alphanumeric + hyphens only
-        - No duplicates
-        """
-        if len(v) > 5:
-            raise ValueError("Maximum 5 tags allowed")
-        
-        validated_tags = []
-        for tag in v:
-            tag = tag.strip().lower()
-            if not tag:
-                continue  # Skip empty tags
-            if len(tag) > 50:
-                raise ValueError(f"Tag '{tag}' exceeds 50 character limit")
-            if not tag.replace('-', '').replace('_', '').isalnum():
-                raise ValueError(
-                    f"Tag '{tag}' contains invalid characters. "
-                    "Use only lowercase alphanumeric and hyphens."
-                )
-            validated_tags.append(tag)
-        
-        # Check for duplicates
-        if len(validated_tags) != len(set(validated_tags)):
-            raise ValueError("Duplicate tags not allowed")
-        
-        return validated_tags
+        """Validate tags format and constraints (see _validate_tags)."""
+        return _validate_tags(v)
 
 
 class ThoughtUpdate(BaseRequestModel):
@@ -127,8 +145,7 @@ class ThoughtUpdate(BaseRequestModel):
         """Validate tags if provided (same rules as ThoughtCreate)."""
         if v is None:
             return v
-        # Reuse validation from ThoughtCreate
-        return ThoughtCreate.validate_tags(v)
+        return _validate_tags(v)
 
 
 class ThoughtResponse(BaseTimestampModel):
@@ -245,32 +262,55 @@ class ThoughtDB(BaseDBModel):
     
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)  # 1-5000 chars validated at app level
-    tags = Column(JSON, nullable=False, default=list)  # Array of strings
+    tags = Column(JSONDocument, nullable=False, default=list)  # Array of strings
     status = Column(
         String(50),
         nullable=False,
         default=ThoughtStatus.ACTIVE.value
     )
-    context = Column(JSON, nullable=True)  # Situational metadata
+    context = Column(JSONDocument, nullable=True)  # Situational metadata
     claude_summary = Column(String(500), nullable=True)
-    claude_analysis = Column(JSON, nullable=True)
-    related_thought_ids = Column(JSON, nullable=False, default=list)
+    claude_analysis = Column(JSONDocument, nullable=True)
+    related_thought_ids = Column(JSONDocument, nullable=False, default=list)
     task_id = Column(String(36), ForeignKey("tasks.id"), nullable=True)
     
     # Phase 3B Spec 2: AI Intelligence Columns
     thought_type = Column(String(50), nullable=True)
     intent_confidence = Column(Float, nullable=True)
-    suggested_tags = Column(JSON, nullable=True)
-    related_topics = Column(JSON, nullable=True)
+    suggested_tags = Column(JSONDocument, nullable=True)
+    related_topics = Column(JSONDocument, nullable=True)
     emotional_tone = Column(String(50), nullable=True)
     urgency = Column(String(20), nullable=True)
     is_actionable = Column(Boolean, nullable=True)
     actionable_confidence = Column(Float, nullable=True)
-    analysis_version = Column(Integer, nullable=True, default=1)
+    analysis_version = Column(Integer, nullable=True, default=1, server_default='1')
     analyzed_at = Column(TZDateTime, nullable=True)
     
+    # Per-user timelines ordered by creation time, plus a partial index for
+    # the active-thought scans used by scheduled consciousness checks.
+    # GIN index for tag containment filters (tags @> '["x"]'). jsonb_path_ops
+    # only supports @>, which is all the tag filter uses, and is smaller
+    # than the default operator class. PostgreSQL only.
+    __table_args__ = (
+        Index('idx_thoughts_user_created', user_id, desc('created_at')),
+        Index(
+            'idx_thoughts_user_active',
+            user_id,
+            'created_at',
+            postgresql_where=status == ThoughtStatus.ACTIVE.value,
+            sqlite_where=status == ThoughtStatus.ACTIVE.value
+        ),
+        Index(
+            'idx_thoughts_tags_gin',
+            tags,
+            postgresql_using='gin',
+            postgresql_ops={'tags': 'jsonb_path_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+    
     # Relationships
-    user = relationship("UserDB", back_populates="thoughts")
+    # Never needed when rendering thoughts; raise instead of lazy-loading per row
+    user = relationship("UserDB", back_populates="thoughts", lazy="raise")
     # Note: This is a separate relationship from TaskDB.source_thought
     # task_id links thought TO a task, source_thought_id links task FROM a thought
     task = relationship("TaskDB", foreign_keys=[task_id], uselist=False)
@@ -288,27 +328,40 @@ class ThoughtDB(BaseDBModel):
     
     def to_response(self) -> ThoughtResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
-        return ThoughtResponse(
-            id=self.id,
-            user_id=self.user_id,
-            content=self.content,
-            tags=self.tags or [],
-            status=ThoughtStatus(self.status),
-            context=self.context,
-            claude_summary=self.claude_summary,
-            claude_analysis=self.claude_analysis,
-            related_thought_ids=self.related_thought_ids or [],
-            task_id=self.task_id,
-            thought_type=ThoughtType(self.thought_type) if self.thought_type else None,
-            intent_confidence=self.intent_confidence,
-            suggested_tags=self.suggested_tags,
-            related_topics=self.related_topics,
-            emotional_tone=EmotionalTone(self.emotional_tone) if self.emotional_tone else None,
-            urgency=Urgency(self.urgency) if self.urgency else None,
-            is_actionable=self.is_actionable,
-            actionable_confidence=self.actionable_confidence,
-            analysis_version=self.analysis_version,
-            analyzed_at=self.analyzed_at,
-            created_at=self.created_at,
-            updated_at=self.updated_at
-        )
+        return self.to_responses((self,))[0]
+    
+    @classmethod
+    def to_responses(cls, rows: Sequence["ThoughtDB"]) -> list[ThoughtResponse]:
+        """Convert many rows to Pydantic response models in one pass."""
+        construct = ThoughtResponse.model_construct
+        status_by_value = _STATUS_BY_VALUE
+        thought_type_by_value = _THOUGHT_TYPE_BY_VALUE
+        emotional_tone_by_value = _EMOTIONAL_TONE_BY_VALUE
+        urgency_by_value = _URGENCY_BY_VALUE
+        return [
+            construct(
+                id=UUID(row.id),
+                user_id=UUID(row.user_id),
+                content=row.content,
+                tags=row.tags or [],
+                status=status_by_value[row.status],
+                context=row.context,
+                claude_summary=row.claude_summary,
+                claude_analysis=row.claude_analysis,
+                related_thought_ids=[UUID(i) for i in row.related_thought_ids or ()],
+                task_id=UUID(row.task_id) if row.task_id else None,
+                thought_type=thought_type_by_value.get(row.thought_type),
+                intent_confidence=row.intent_confidence,
+                suggested_tags=row.suggested_tags,
+                related_topics=row.related_topics,
+                emotional_tone=emotional_tone_by_value.get(row.emotional_tone),
+                urgency=urgency_by_value.get(row.urgency),
+                is_actionable=row.is_actionable,
+                actionable_confidence=row.actionable_confidence,
+                analysis_version=row.analysis_version,
+                analyzed_at=row.analyzed_at,
+                created_at=row.created_at,
+                updated_at=row.updated_at
+            )
+            for row in rows
+        ]
@@ -5,6 +5,7 @@ Defines user accounts, preferences, and authentication. Supports
 multi-user architecture with RBAC foundation (Phase 3B).
 """
 
+import re
 from datetime import datetime
 from typing import Any, Dict, Optional, TYPE_CHECKING
 from uuid import UUID
@@ -17,6 +18,23 @@ from .base import BaseTimestampModel, BaseRequestModel, BaseDBModel, TZDateTime
 from .enums import UserRole
 
 
+# Value -> member lookup used when converting database rows
+_ROLE_BY_VALUE = {m.value: m for m in UserRole}
+
+# local@domain.tld with no whitespace or extra '@'
+_EMAIL_RE = re.compile(r'\A[^@\s]+@[^@\s]+\.[^@\s]+\Z')
+
+
+def _validate_email(v: str) -> str:
+    """Normalize and validate email format."""
+    v = v.strip().lower()
+    if not v:
+        raise ValueError("Email cannot be empty")
+    if _EMAIL_RE.match(v) is None:
+        raise ValueError("Invalid email format")
+    return v
+
+
 class UserCreate(BaseRequestModel):
     """
     Model for creating a new user account.
@@ -60,12 +78,7 @@ class UserCreate(BaseRequestModel):
     @classmethod
     def validate_email(cls, v: str) -> str:
         """Validate email format."""
-        v = v.strip().lower()
-        if not v:
-            raise ValueError("Email cannot be empty")
-        if '@' not in v or '.' not in v.split('@')[1]:
-            raise ValueError("Invalid email format")
-        return v
+        return _validate_email(v)
 
 
 class UserUpdate(BaseRequestModel):
@@ -94,11 +107,7 @@ class UserUpdate(BaseRequestModel):
     def validate_email(cls, v: Optional[str]) -> Optional[str]:
         """Validate email if provided."""
         if v is not None:
-            v = v.strip().lower()
-            if not v:
-                raise ValueError("Email cannot be empty")
-            if '@' not in v or '.' not in v.split('@')[1]:
-                raise ValueError("Invalid email format")
+            return _validate_email(v)
         return v
 
 
@@ -191,13 +200,13 @@ class UserDB(BaseDBModel):
     
     def to_response(self) -> UserResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
-        return UserResponse(
-            id=self.id,
+        return UserResponse.model_construct(
+            id=UUID(self.id),
             name=self.name,
             email=self.email,
             preferences=self.preferences or {},
             is_active=self.is_active,
-            role=UserRole(self.role),
+            role=_ROLE_BY_VALUE[self.role],
             last_login_at=self.last_login_at,
             created_at=self.created_at,
             updated_at=self.updated_at
@@ -10,8 +10,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
-from sqlalchemy import Column, String, Text, Boolean, JSON, ForeignKey, DateTime
+from pydantic import ConfigDict, Field, field_validator
+from sqlalchemy import Column, String, Text, Boolean, JSON, ForeignKey, DateTime, true
 from sqlalchemy.orm import relationship
 
 from .base import (
@@ -23,6 +23,15 @@ from .base import (
 )
 from .enums import PreferredTone, DetailLevel
 
+_PROJECT_STATUS_ORDER = ('active', 'planning', 'paused', 'completed')
+_PROJECT_STATUSES = frozenset(_PROJECT_STATUS_ORDER)
+_PROJECT_STATUS_ERROR = f"Status must be one of: {', '.join(_PROJECT_STATUS_ORDER)}"
+
+
+def _normalize_interests(v: List[str]) -> List[str]:
+    """Strip, lowercase and deduplicate interests, keeping first-seen order."""
+    return list(dict.fromkeys(s for i in v if (s := i.strip().lower())))
+
 
 class OngoingProject(BaseRequestModel):
     """
@@ -58,10 +67,10 @@ class OngoingProject(BaseRequestModel):
     @classmethod
     def validate_status(cls, v: str) -> str:
         """Validate status is one of allowed values."""
-        valid = ['active', 'planning', 'paused', 'completed']
-        if v.lower() not in valid:
-            raise ValueError(f"Status must be one of: {', '.join(valid)}")
-        return v.lower()
+        status = v.lower()
+        if status not in _PROJECT_STATUSES:
+            raise ValueError(_PROJECT_STATUS_ERROR)
+        return status
 
 
 class ThoughtPattern(BaseRequestModel):
@@ -126,8 +135,7 @@ class UserProfileCreate(BaseRequestModel):
     @classmethod
     def validate_interests(cls, v: List[str]) -> List[str]:
         """Validate and normalize interests."""
-        # Deduplicate and lowercase
-        return list(set(i.strip().lower() for i in v if i.strip()))
+        return _normalize_interests(v)
 
 
 class UserProfileUpdate(BaseRequestModel):
@@ -154,7 +162,28 @@ class UserProfileUpdate(BaseRequestModel):
         """Validate interests if provided."""
         if v is None:
             return v
-        return list(set(i.strip().lower() for i in v if i.strip()))
+        return _normalize_interests(v)
+
+
+_USER_PROFILE_EXAMPLE = {
+    "id": "550e8400-e29b-41d4-a716-446655440000",
+    "user_id": "550e8400-e29b-41d4-a716-446655440001",
+    "ongoing_projects": [
+        {
+            "name": "Personal AI Assistant",
+            "status": "active",
+            "description": "Building thought capture system"
+        }
+    ],
+    "interests": ["automation", "AI", "infrastructure"],
+    "work_style": "methodical, do it right",
+    "common_themes": ["productivity", "automation"],
+    "preferred_tone": "warm_encouraging",
+    "detail_level": "moderate",
+    "reference_past_work": True,
+    "created_at": "2025-12-26T10:00:00Z",
+    "updated_at": "2025-12-26T10:00:00Z"
+}
 
 
 class UserProfileResponse(BaseTimestampModel):
@@ -164,6 +193,8 @@ class UserProfileResponse(BaseTimestampModel):
     Includes all profile fields plus discovered patterns.
     """
     
+    model_config = ConfigDict(json_schema_extra={"example": _USER_PROFILE_EXAMPLE})
+    
     user_id: str = Field(..., description="ID of the user this profile belongs to")
     
     # Personal context
@@ -217,30 +248,6 @@ class UserProfileResponse(BaseTimestampModel):
         default=None,
         description="When patterns were last updated from analysis"
     )
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
-            "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
-                "user_id": "550e8400-e29b-41d4-a716-446655440001",
-                "ongoing_projects": [
-                    {
-                        "name": "Personal AI Assistant",
-                        "status": "active",
-                        "description": "Building thought capture system"
-                    }
-                ],
-                "interests": ["automation", "AI", "infrastructure"],
-                "work_style": "methodical, do it right",
-                "common_themes": ["productivity", "automation"],
-                "preferred_tone": "warm_encouraging",
-                "detail_level": "moderate",
-                "reference_past_work": True,
-                "created_at": "2025-12-26T10:00:00Z",
-                "updated_at": "2025-12-26T10:00:00Z"
-            }
-        }
 
 
 class UserProfileDB(BaseDBModel):
@@ -282,7 +289,7 @@ class UserProfileDB(BaseDBModel):
         nullable=False,
         default=DetailLevel.MODERATE.value
     )
-    reference_past_work = Column(Boolean, nullable=False, default=True)
+    reference_past_work = Column(Boolean, nullable=False, default=True, server_default=true())
     
     # Last analysis update
     last_analysis_update = Column(TZDateTime, nullable=True)
@@ -299,6 +306,20 @@ class UserProfileDB(BaseDBModel):
             f"tone={self.preferred_tone})>"
         )
     
+    def apply_analysis(self, patch: Dict[str, Any]) -> None:
+        """
+        Apply analysis results and stamp the analysis time.
+        
+        All fields share one timestamp and are flushed together as a
+        single UPDATE. Values must be new objects: JSON columns are not
+        mutation-tracked, so an in-place edit would not be saved.
+        """
+        now = utc_now()
+        for field_name, value in patch.items():
+            setattr(self, field_name, value)
+        self.last_analysis_update = now
+        self.updated_at = now
+    
     def to_response(self) -> UserProfileResponse:
         """Convert SQLAlchemy model to Pydantic response model."""
         return UserProfileResponse(
@@ -13,7 +13,7 @@ The protocol ensures:
 5. Observability (request tracing)
 """
 
-from typing import Protocol, Union
+from typing import Any, Protocol, Union, runtime_checkable
 from src.services.ai_backends.models import (
     BackendRequest,
     SuccessResponse,
@@ -21,6 +21,7 @@ from src.services.ai_backends.models import (
 )
 
 
+@runtime_checkable
 class AIBackend(Protocol):
     """
     Protocol for AI backend implementations.
@@ -118,7 +119,7 @@ class AIBackend(Protocol):
         ...
 
 
-def validate_backend(backend: any) -> bool:
+def validate_backend(backend: Any) -> bool:
     """
     Validate that an object satisfies AIBackend protocol.
     
@@ -139,20 +140,12 @@ def validate_backend(backend: any) -> bool:
         if validate_backend(backend):
             registry.register("claude", backend)
     """
-    required_attrs = ["name", "analyze", "health_check"]
-    
-    for attr in required_attrs:
-        if not hasattr(backend, attr):
-            return False
-    
-    # Check name is a property/string
-    if not isinstance(backend.name, str):
-        return False
-    
-    # Check methods are callable
-    if not callable(getattr(backend, "analyze")):
-        return False
-    if not callable(getattr(backend, "health_check")):
+    # Structural check for name/analyze/health_check presence
+    if not isinstance(backend, AIBackend):
         return False
     
-    return True
+    return (
+        isinstance(backend.name, str)
+        and callable(backend.analyze)
+        and callable(backend.health_check)
+    )
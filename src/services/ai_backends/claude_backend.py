@@ -8,9 +8,13 @@ to protocol-compliant formats.
 
 import logging
 import asyncio
+import hashlib
 import time
-from typing import Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import List, Union
 
 from anthropic import (
     APIError as AnthropicAPIError,
@@ -18,7 +22,8 @@ from anthropic import (
     RateLimitError as AnthropicRateLimitError,
 )
 
-from src.services.claude_service import ClaudeService
+from src.services.claude_service import get_claude_service
+from src.models.base import utc_now
 from src.services.ai_backends.models import (
     BackendRequest,
     SuccessResponse,
@@ -41,6 +46,35 @@ from src.services.ai_backends.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Bounded pool for the synchronous Anthropic SDK calls, so bursts of
+# analyses cannot grow the loop's default executor without limit
+_CLAUDE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="claude")
+
+# Successful responses kept per backend for idempotent retries
+_RESPONSE_CACHE_SIZE = 1024
+
+# How long a health probe result is trusted. Failures expire sooner so
+# a recovered API is noticed quickly.
+_HEALTH_TTL_OK = 30.0
+_HEALTH_TTL_FAILED = 5.0
+_HEALTH_PROBE_TIMEOUT = 2.0
+
+
+@dataclass(slots=True)
+class ThoughtView:
+    """
+    Plain, unpersisted stand-in for ThoughtDB.
+
+    Carries just the attributes ClaudeService.analyze_thought() reads,
+    without SQLAlchemy instrumentation or session state.
+    """
+    id: str
+    user_id: str
+    content: str
+    tags: List[str] = field(default_factory=list)
+    status: str = "active"
+    created_at: datetime = field(default_factory=utc_now)
+
 
 class ClaudeBackend:
     """
@@ -65,8 +99,15 @@ class ClaudeBackend:
         Args:
             api_key: Anthropic API key (uses env var if not provided)
         """
-        self._claude = ClaudeService(api_key=api_key)
+        self._claude = get_claude_service(api_key)
         self._name = "claude"
+        # (request_id, content digest) -> SuccessResponse, least recent first.
+        # Only touched from analyze() on the event loop, so no lock needed.
+        self._responses: "OrderedDict[tuple, SuccessResponse]" = OrderedDict()
+        # Cached health probe result; see health_check()
+        self._health_cached = True
+        self._health_cache_expiry = 0.0
+        self._health_lock = asyncio.Lock()
     
     @property
     def name(self) -> str:
@@ -87,7 +128,18 @@ class ClaudeBackend:
             SuccessResponse if successful
             ErrorResponse if failed
         """
-        start_time = time.time()
+        # Idempotency: a repeated request_id with the same content gets the
+        # stored result instead of a second API call
+        cache_key = (
+            request.request_id,
+            hashlib.blake2b(request.thought_content.encode(), digest_size=16).digest()
+        )
+        cached = self._responses.get(cache_key)
+        if cached is not None:
+            self._responses.move_to_end(cache_key)
+            return cached
+        
+        start_ns = time.perf_counter_ns()
         
         try:
             # Run analysis with timeout
@@ -96,13 +148,17 @@ class ClaudeBackend:
                 timeout=request.timeout_seconds
             )
             
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
-            return self._build_success_response(
+            response = self._build_success_response(
                 request=request,
                 result=result,
                 processing_time_ms=processing_time_ms
             )
+            self._responses[cache_key] = response
+            if len(self._responses) > _RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+            return response
             
         except asyncio.TimeoutError:
             return self._build_timeout_error(request)
@@ -126,9 +182,9 @@ class ClaudeBackend:
         Claude SDK is synchronous, so we run it in
         a thread pool to avoid blocking.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None,
+            _CLAUDE_EXECUTOR,
             self._analyze_sync,
             request
         )
@@ -137,20 +193,13 @@ class ClaudeBackend:
         """
         Synchronous analysis call.
         
-        Creates a temporary ThoughtDB-like object and calls
+        Builds a transient ThoughtView and calls
         ClaudeService.analyze_thought().
         """
-        # Create minimal thought object for ClaudeService
-        from src.models.thought import ThoughtDB
-        
-        thought = ThoughtDB(
+        thought = ThoughtView(
             id="temp-id",
             user_id=request.context.get("user_id", "unknown"),
             content=request.thought_content,
-            tags=[],
-            status="active",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
         )
         
         # Call existing ClaudeService
@@ -196,7 +245,7 @@ class ClaudeBackend:
             tokens_used=result.get("tokens_used", 0),
             processing_time_ms=processing_time_ms,
             model_version=self._claude.model,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=utc_now().isoformat()
         )
         
         return SuccessResponse(
@@ -278,17 +327,45 @@ class ClaudeBackend:
         """
         Check if Claude API is reachable.
         
+        Makes a lightweight models listing call, cached for 30 seconds
+        after a success and 5 seconds after a failure. Concurrent callers
+        share a single in-flight probe.
+        
         Returns:
             bool: True if healthy
         """
-        try:
-            # Quick test: check if client is initialized
-            if not self._claude or not self._claude.client:
-                return False
+        if time.monotonic() < self._health_cache_expiry:
+            return self._health_cached
+        
+        async with self._health_lock:
+            # Another caller may have refreshed it while we waited
+            if time.monotonic() < self._health_cache_expiry:
+                return self._health_cached
             
-            # Could optionally make a minimal API call here
-            # For now, just check initialization
-            return True
+            try:
+                if not self._claude or not self._claude.client:
+                    healthy = False
+                else:
+                    loop = asyncio.get_running_loop()
+                    await asyncio.wait_for(
+                        loop.run_in_executor(_CLAUDE_EXECUTOR, self._probe_sync),
+                        timeout=_HEALTH_PROBE_TIMEOUT
+                    )
+                    healthy = True
+            except Exception as e:
+                logger.warning(f"Claude health probe failed: {type(e).__name__}: {e}")
+                healthy = False
             
-        except Exception:
-            return False
+            ttl = _HEALTH_TTL_OK if healthy else _HEALTH_TTL_FAILED
+            self._health_cached = healthy
+            self._health_cache_expiry = time.monotonic() + ttl
+            return healthy
+    
+    def _probe_sync(self) -> None:
+        """Cheapest authenticated call available: list one model."""
+        # No retries and a matching SDK timeout, so a hung probe doesn't
+        # keep an executor worker busy after wait_for gives up
+        self._claude.client.with_options(max_retries=0).models.list(
+            limit=1,
+            timeout=_HEALTH_PROBE_TIMEOUT
+        )
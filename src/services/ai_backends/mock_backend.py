@@ -22,6 +22,43 @@ from src.services.ai_backends.models import (
 )
 
 
+# mode -> (error_code, error_message, suggestion); {timeout} is filled
+# from the request
+_MOCK_ERRORS = {
+    "mock-timeout": (
+        "TIMEOUT",
+        "Mock timeout after {timeout}s",
+        "This is a mock timeout for testing",
+    ),
+    "mock-unavailable": (
+        "UNAVAILABLE",
+        "Mock backend unavailable",
+        "This is a mock unavailability for testing",
+    ),
+    "mock-rate-limited": (
+        "RATE_LIMITED",
+        "Mock rate limit exceeded",
+        "Retry after 60s (mock)",
+    ),
+    "mock-malformed": (
+        "MALFORMED_RESPONSE",
+        "Mock malformed response",
+        "This is a mock malformed response for testing",
+    ),
+}
+
+# Canned themes/actions; frozen models, so one instance is shared
+_THEME_EMAIL = Theme(theme="email", confidence=0.95)
+_THEME_OPTIMIZATION = Theme(theme="optimization", confidence=0.90)
+_THEME_TASKS = Theme(theme="task management", confidence=0.85)
+_THEME_GENERAL = Theme(theme="general", confidence=0.70)
+_ACTION_CREATE_TASK = SuggestedAction(
+    action="Create task for this thought",
+    priority="medium",
+    confidence=0.80
+)
+
+
 class MockBackend:
     """
     Mock backend for testing.
@@ -51,6 +88,8 @@ class MockBackend:
         """
         self._mode = mode
         self._name = mode
+        # Resolved once; None means the success path
+        self._error_spec = _MOCK_ERRORS.get(mode)
     
     @property
     def name(self) -> str:
@@ -70,35 +109,18 @@ class MockBackend:
         Returns:
             SuccessResponse or ErrorResponse based on mode
         """
-        # Simulate some processing time
-        start_time = time.time()
-        
-        if self._mode == "mock-success":
-            return self._mock_success(request, start_time)
-        
-        elif self._mode == "mock-timeout":
-            return self._mock_timeout(request)
+        if self._error_spec is not None:
+            return self._mock_error(request, *self._error_spec)
         
-        elif self._mode == "mock-unavailable":
-            return self._mock_unavailable(request)
-        
-        elif self._mode == "mock-rate-limited":
-            return self._mock_rate_limited(request)
-        
-        elif self._mode == "mock-malformed":
-            return self._mock_malformed(request)
-        
-        else:
-            # Default to success
-            return self._mock_success(request, start_time)
+        # mock-success, and the default for unknown modes
+        return self._mock_success(request)
     
     def _mock_success(
         self,
-        request: BackendRequest,
-        start_time: float
+        request: BackendRequest
     ) -> SuccessResponse:
         """Return successful analysis"""
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        start_ns = time.perf_counter_ns()
         
         # Generate deterministic response based on content
         content_lower = request.thought_content.lower()
@@ -106,26 +128,20 @@ class MockBackend:
         # Extract themes based on keywords
         themes = []
         if "email" in content_lower:
-            themes.append(Theme(theme="email", confidence=0.95))
+            themes.append(_THEME_EMAIL)
         if "optimize" in content_lower or "improve" in content_lower:
-            themes.append(Theme(theme="optimization", confidence=0.90))
+            themes.append(_THEME_OPTIMIZATION)
         if "task" in content_lower:
-            themes.append(Theme(theme="task management", confidence=0.85))
+            themes.append(_THEME_TASKS)
         
         # Default theme if none detected
         if not themes:
-            themes.append(Theme(theme="general", confidence=0.70))
+            themes.append(_THEME_GENERAL)
         
         # Generate suggested actions
         actions = []
         if "should" in content_lower or "need to" in content_lower:
-            actions.append(
-                SuggestedAction(
-                    action="Create task for this thought",
-                    priority="medium",
-                    confidence=0.80
-                )
-            )
+            actions.append(_ACTION_CREATE_TASK)
         
         analysis = Analysis(
             request_id=request.request_id,
@@ -136,6 +152,8 @@ class MockBackend:
             related_thought_ids=[]
         )
         
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        
         metadata = AnalysisMetadata(
             tokens_used=100,
             processing_time_ms=processing_time_ms,
@@ -149,64 +167,22 @@ class MockBackend:
             metadata=metadata
         )
     
-    def _mock_timeout(self, request: BackendRequest) -> ErrorResponse:
-        """Return timeout error"""
-        return ErrorResponse(
-            success=False,
-            error=ErrorDetails(
-                request_id=request.request_id,
-                backend_name=self.name,
-                error_code="TIMEOUT",
-                error_message=f"Mock timeout after {request.timeout_seconds}s",
-                suggestion="This is a mock timeout for testing"
-            )
-        )
-    
-    def _mock_unavailable(
+    def _mock_error(
         self,
-        request: BackendRequest
-    ) -> ErrorResponse:
-        """Return unavailable error"""
-        return ErrorResponse(
-            success=False,
-            error=ErrorDetails(
-                request_id=request.request_id,
-                backend_name=self.name,
-                error_code="UNAVAILABLE",
-                error_message="Mock backend unavailable",
-                suggestion="This is a mock unavailability for testing"
-            )
-        )
-    
-    def _mock_rate_limited(
-        self,
-        request: BackendRequest
-    ) -> ErrorResponse:
-        """Return rate limit error"""
-        return ErrorResponse(
-            success=False,
-            error=ErrorDetails(
-                request_id=request.request_id,
-                backend_name=self.name,
-                error_code="RATE_LIMITED",
-                error_message="Mock rate limit exceeded",
-                suggestion="Retry after 60s (mock)"
-            )
-        )
-    
-    def _mock_malformed(
-        self,
-        request: BackendRequest
+        request: BackendRequest,
+        error_code: str,
+        message: str,
+        suggestion: str
     ) -> ErrorResponse:
-        """Return malformed response error"""
+        """Return the canned error for the current mode"""
         return ErrorResponse(
             success=False,
             error=ErrorDetails(
                 request_id=request.request_id,
                 backend_name=self.name,
-                error_code="MALFORMED_RESPONSE",
-                error_message="Mock malformed response",
-                suggestion="This is a mock malformed response for testing"
+                error_code=error_code,
+                error_message=message.format(timeout=request.timeout_seconds),
+                suggestion=suggestion
             )
         )
     
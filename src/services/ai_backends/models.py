@@ -7,8 +7,8 @@ contracts across all implementations.
 """
 
 from datetime import datetime, UTC
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Annotated, Literal, Optional
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints
 
 
 class BackendRequest(BaseModel):
@@ -34,10 +34,12 @@ class BackendRequest(BaseModel):
         ...,
         description="Unique request identifier for tracing"
     )
-    thought_content: str = Field(
+    # Stripped before the length check, so whitespace-only content fails
+    # min_length inside pydantic-core rather than in a Python validator
+    thought_content: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1, max_length=5000)
+    ] = Field(
         ...,
-        min_length=1,
-        max_length=5000,
         description="The thought to analyze (1-5000 characters)"
     )
     context: Optional[dict] = Field(
@@ -50,7 +52,7 @@ class BackendRequest(BaseModel):
         le=300,
         description="Max time to wait for analysis (5-300 seconds)"
     )
-    model_hint: Optional[str] = Field(
+    model_hint: Optional[Literal["fast", "quality", "cheap"]] = Field(
         default=None,
         description="Suggestion for model selection: 'fast', 'quality', or 'cheap'"
     )
@@ -58,24 +60,6 @@ class BackendRequest(BaseModel):
         default=True,
         description="Include confidence scores in response"
     )
-    
-    @field_validator("thought_content")
-    @classmethod
-    def validate_content_not_empty(cls, v):
-        """Ensure content is not just whitespace"""
-        if not v or not v.strip():
-            raise ValueError("thought_content cannot be empty or whitespace")
-        return v.strip()
-    
-    @field_validator("model_hint")
-    @classmethod
-    def validate_model_hint(cls, v):
-        """Ensure model hint is valid if provided"""
-        if v is not None and v not in ["fast", "quality", "cheap"]:
-            raise ValueError(
-                "model_hint must be one of: 'fast', 'quality', 'cheap'"
-            )
-        return v
 
 
 class Theme(BaseModel):
@@ -86,6 +70,8 @@ class Theme(BaseModel):
         Theme(theme="email management", confidence=0.85)
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     theme: str = Field(
         ...,
         min_length=1,
@@ -112,13 +98,15 @@ class SuggestedAction(BaseModel):
         )
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     action: str = Field(
         ...,
         min_length=1,
         max_length=200,
         description="Suggested action"
     )
-    priority: str = Field(
+    priority: Literal["low", "medium", "high", "critical"] = Field(
         default="medium",
         description="Priority: low, medium, high, critical"
     )
@@ -128,15 +116,6 @@ class SuggestedAction(BaseModel):
         le=1.0,
         description="Confidence score (0.0-1.0)"
     )
-    
-    @field_validator("priority")
-    @classmethod
-    def validate_priority(cls, v):
-        """Ensure priority is valid"""
-        valid = ["low", "medium", "high", "critical"]
-        if v not in valid:
-            raise ValueError(f"priority must be one of: {', '.join(valid)}")
-        return v
 
 
 class Analysis(BaseModel):
@@ -9,11 +9,12 @@ import logging
 import asyncio
 import time
 import json
-from typing import Union
-from datetime import datetime
+from typing import Optional, Union
 
 import httpx
+import orjson
 
+from src.models.base import utc_now
 from src.services.ai_backends.models import (
     BackendRequest,
     SuccessResponse,
@@ -25,6 +26,7 @@ from src.services.ai_backends.models import (
     SuggestedAction,
 )
 from src.services.ai_backends.exceptions import (
+    BackendError,
     BackendTimeoutError,
     BackendUnavailableError,
     BackendRateLimitError,
@@ -34,6 +36,30 @@ from src.services.ai_backends.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"content-type": "application/json"}
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(text: str) -> Optional[dict]:
+    """
+    Return the first complete JSON object embedded in model output.
+    
+    raw_decode stops at the end of the object it starts on, so prose
+    braces before or after the JSON (or inside its strings) don't
+    break extraction the way a first-"{"/last-"}" slice does.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
+            pass
+        else:
+            if isinstance(obj, dict):
+                return obj
+        start = text.find("{", start + 1)
+    return None
+
 
 class OllamaBackend:
     """
@@ -52,7 +78,8 @@ class OllamaBackend:
     def __init__(
         self,
         base_url: str = "http://192.168.7.187:11434",
-        model: str = "gemma3:27b"
+        model: str = "gemma3:27b",
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """
         Initialize Ollama backend.
@@ -60,11 +87,20 @@ class OllamaBackend:
         Args:
             base_url: Ollama server URL
             model: Model to use (e.g., "gemma3:27b", "deepseek-r1:70b")
+            transport: Optional httpx transport (tests pass a MockTransport)
         """
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._name = "ollama"
         self._chat_url = f"{self._base_url}/api/chat"
+        # One pooled client per backend so connections are kept alive
+        # between calls; closed by aclose() on shutdown
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(60.0),
+            transport=transport,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
     
     @property
     def name(self) -> str:
@@ -85,7 +121,7 @@ class OllamaBackend:
             SuccessResponse if successful
             ErrorResponse if failed
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Build prompt
@@ -97,7 +133,7 @@ class OllamaBackend:
                 timeout=request.timeout_seconds
             )
             
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             # Parse response
             analysis_data = self._parse_response(result)
@@ -114,6 +150,9 @@ class OllamaBackend:
         except httpx.ConnectError as e:
             return self._build_unavailable_error(request, str(e))
         
+        except BackendError as e:
+            return self._build_backend_error(request, e)
+        
         except Exception as e:
             return self._build_internal_error(request, e)
     
@@ -121,28 +160,34 @@ class OllamaBackend:
         """
         Make async HTTP call to Ollama chat API.
         """
-        async with httpx.AsyncClient() as client:
-            payload = {
-                "model": self._model,
-                "messages": [
-                    {"role": "user", "content": prompt}
-                ],
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                }
+        payload = {
+            "model": self._model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "stream": False,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
             }
-            logger.info(f"Ollama Request URL: {self._chat_url}")
-            logger.debug(f"Ollama Payload: {json.dumps(payload)}")
-            
-            response = await client.post(
-                self._chat_url,
-                json=payload,
-                timeout=60.0
-            )
-            response.raise_for_status()
-            return response.json()
+        }
+        body = orjson.dumps(payload)
+        logger.info(f"Ollama Request URL: {self._chat_url}")
+        logger.debug("Ollama Payload: %s", body)
+        
+        response = await self._client.post(
+            "/api/chat",
+            content=body,
+            headers=_JSON_HEADERS
+        )
+        status = response.status_code
+        if status == 429:
+            raise BackendRateLimitError(self.name)
+        if status >= 500:
+            raise BackendUnavailableError(self.name, f"HTTP {status}")
+        if not response.is_success:
+            raise BackendMalformedResponseError(self.name, f"HTTP {status}")
+        return orjson.loads(response.content)
     
     def _build_prompt(self, thought_content: str) -> str:
         """
@@ -184,31 +229,17 @@ Analysis:"""
         text = message.get("content", "")
         
         # Try to extract JSON from response
-        try:
-            # Look for JSON in the response
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            
-            if start != -1 and end > start:
-                json_str = text[start:end]
-                return json.loads(json_str)
-            
-            # Fallback if no JSON found
-            return {
-                "summary": text[:200] if text else "Analysis completed",
-                "themes": [],
-                "is_actionable": False,
-                "insights": []
-            }
-            
-        except json.JSONDecodeError:
-            # Return minimal response if parsing fails
-            return {
-                "summary": text[:200] if text else "Analysis completed",
-                "themes": [],
-                "is_actionable": False,
-                "insights": []
-            }
+        data = _extract_json_object(text)
+        if data is not None:
+            return data
+        
+        # Fallback if no JSON found or parsing fails
+        return {
+            "summary": text[:200] if text else "Analysis completed",
+            "themes": [],
+            "is_actionable": False,
+            "insights": []
+        }
     
     def _build_success_response(
         self,
@@ -251,7 +282,7 @@ Analysis:"""
             tokens_used=0,  # Ollama doesn't report tokens
             processing_time_ms=processing_time_ms,
             model_version=self._model,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=utc_now().isoformat()
         )
         
         return SuccessResponse(
@@ -289,7 +320,30 @@ Analysis:"""
                 backend_name=self.name,
                 error_code="UNAVAILABLE",
                 error_message=f"Ollama server unreachable: {details}",
-                suggestion="Check if Ollama is running at {self._base_url}"
+                suggestion=f"Check if Ollama is running at {self._base_url}"
+            )
+        )
+    
+    def _build_backend_error(
+        self,
+        request: BackendRequest,
+        exc: BackendError
+    ) -> ErrorResponse:
+        """Build error response from a classified HTTP failure"""
+        suggestions = {
+            "RATE_LIMITED": "Retry after a few seconds or use fallback backend",
+            "UNAVAILABLE": f"Check Ollama server health at {self._base_url}",
+        }
+        return ErrorResponse(
+            success=False,
+            error=ErrorDetails(
+                request_id=request.request_id,
+                backend_name=self.name,
+                error_code=exc.error_code,
+                error_message=exc.message,
+                suggestion=suggestions.get(
+                    exc.error_code, "Check the model name and Ollama logs"
+                )
             )
         )
     
@@ -320,12 +374,12 @@ Analysis:"""
             bool: True if healthy
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self._base_url}/api/tags",
-                    timeout=5.0
-                )
-                return response.status_code == 200
-                
+            response = await self._client.get("/api/tags", timeout=5.0)
+            return response.status_code == 200
+            
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
\ No newline at end of file
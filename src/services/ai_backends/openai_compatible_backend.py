@@ -9,7 +9,7 @@ import logging
 import asyncio
 import time
 import json
-from typing import Union
+from typing import Optional, Union
 from datetime import datetime, UTC
 
 import httpx
@@ -52,7 +52,8 @@ class OpenAICompatibleBackend:
     def __init__(
         self,
         base_url: str = "http://localhost:1234/v1",
-        model: str = "local-model"
+        model: str = "local-model",
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """
         Initialize OpenAI-compatible backend.
@@ -60,6 +61,7 @@ class OpenAICompatibleBackend:
         Args:
             base_url: Server URL (e.g. http://host:8080/v1)
             model: Model identifier (may be ignored by some servers)
+            transport: Optional httpx transport (tests pass a MockTransport)
         """
         self._base_url = base_url.rstrip("/")
         self._model = model
@@ -68,6 +70,14 @@ class OpenAICompatibleBackend:
         self._models_url = f"{self._base_url}/models"
         # Enforce serial processing to prevent GPU crashes on the host
         self._semaphore = asyncio.Semaphore(1)
+        # One pooled client per backend so connections are kept alive
+        # between calls; closed by aclose() on shutdown
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(60.0),
+            transport=transport,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
     
     @property
     def name(self) -> str:
@@ -88,7 +98,7 @@ class OpenAICompatibleBackend:
             SuccessResponse if successful
             ErrorResponse if failed
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Acquire semaphore to ensure only one request runs at a time
@@ -102,7 +112,7 @@ class OpenAICompatibleBackend:
                     timeout=request.timeout_seconds
                 )
             
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             # Parse response
             analysis_data = self._parse_response(result)
@@ -130,24 +140,22 @@ class OpenAICompatibleBackend:
         """
         Make async HTTP call to the OpenAI-compatible API.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self._chat_url,
-                json={
-                    "model": self._model,
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 2048,
-                    "stream": False
-                },
-                timeout=60.0
-            )
-            if response.status_code == 400:
-                logger.error(f"OpenAI-compatible API 400 Error: {response.text}")
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post(
+            "/chat/completions",
+            json={
+                "model": self._model,
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": 0.7,
+                "max_tokens": 2048,
+                "stream": False
+            }
+        )
+        if response.status_code == 400:
+            logger.error(f"OpenAI-compatible API 400 Error: {response.text}")
+        response.raise_for_status()
+        return response.json()
     
     def _build_prompt(self, thought_content: str) -> str:
         """
@@ -317,21 +325,21 @@ Analysis:"""
             bool: True if healthy
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self._models_url,
-                    timeout=5.0
-                )
-                if response.status_code == 200:
-                    logger.info(f"OpenAI health check: SUCCESS (HTTP {response.status_code})")
-                    return True
-                else:
-                    logger.warning(f"OpenAI health check: FAILED - HTTP {response.status_code}")
-                    return False
-                
+            response = await self._client.get("/models", timeout=5.0)
+            if response.status_code == 200:
+                logger.info(f"OpenAI health check: SUCCESS (HTTP {response.status_code})")
+                return True
+            else:
+                logger.warning(f"OpenAI health check: FAILED - HTTP {response.status_code}")
+                return False
+            
         except Exception as e:
             logger.error(
                 f"OpenAI health check: EXCEPTION - {type(e).__name__}: {str(e)} "
                 f"(URL: {self._models_url})"
             )
             return False
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
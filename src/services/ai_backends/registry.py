@@ -244,3 +244,21 @@ class AIBackendRegistry:
                 health[name] = False
         
         return health
+    
+    @classmethod
+    async def close_all(cls) -> None:
+        """
+        Release resources held by registered backends.
+        
+        Calls aclose() on every backend that defines it (for example
+        pooled HTTP clients). Errors are logged, not raised, so one
+        backend cannot block shutdown of the others.
+        """
+        for name, backend in cls._backends.items():
+            aclose = getattr(backend, "aclose", None)
+            if aclose is None:
+                continue
+            try:
+                await aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close backend {name}: {e}")
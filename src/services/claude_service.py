@@ -11,6 +11,7 @@ Handles communication with Anthropic's Claude API for:
 
 import logging
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
@@ -351,7 +352,8 @@ Extract tasks in JSON format."""
         Deep analysis of a single thought.
 
         Args:
-            thought: The thought to analyze
+            thought: The thought to analyze (a ThoughtDB, or any object
+                with content, tags and created_at)
             context_thoughts: Recent related thoughts for context
 
         Returns:
@@ -419,3 +421,32 @@ Provide analysis in JSON format."""
                 "is_actionable": False,
                 "tokens_used": response["tokens_input"] + response["tokens_output"]
             }
+
+
+@lru_cache(maxsize=None)
+def _claude_service_for_key(api_key: str) -> ClaudeService:
+    """Build one ClaudeService per API key for the process lifetime."""
+    return ClaudeService(api_key=api_key)
+
+
+def get_claude_service(api_key: Optional[str] = None) -> ClaudeService:
+    """
+    Get the shared ClaudeService for an API key.
+    
+    ClaudeService holds no per-request state, and the Anthropic client it
+    wraps is safe to share, so callers reuse one instance (and its HTTP
+    connection pool) instead of constructing a client per request.
+    
+    Args:
+        api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+        
+    Returns:
+        ClaudeService: Shared service instance for the resolved key
+        
+    Raises:
+        ValueError: If no API key is provided or configured
+    """
+    api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not found in environment or provided")
+    return _claude_service_for_key(api_key)
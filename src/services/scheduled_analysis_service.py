@@ -11,7 +11,7 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from ..models.base import utc_now
 from ..models.enums import ScheduledAnalysisStatus, ThoughtStatus
@@ -272,13 +272,18 @@ class ScheduledAnalysisService:
         # Get total count
         total = query.count()
         
-        # Get paginated results
-        analyses = query.order_by(
+        # Get paginated results. Responses never touch the user or
+        # analysis_result relationships, so forbid lazy loads to keep the
+        # page at a single SELECT instead of one extra query per row.
+        analyses = query.options(
+            raiseload(ScheduledAnalysisDB.user),
+            raiseload(ScheduledAnalysisDB.analysis_result),
+        ).order_by(
             desc(ScheduledAnalysisDB.scheduled_at)
         ).offset(offset).limit(limit).all()
         
         return ScheduledAnalysisHistoryResponse(
-            analyses=[a.to_response() for a in analyses],
+            analyses=ScheduledAnalysisDB.to_responses(analyses),
             total=total,
             limit=limit,
             offset=offset,
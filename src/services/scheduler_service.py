@@ -274,7 +274,7 @@ def run_consciousness_check_job(user_id: str):
             from .scheduled_analysis_service import ScheduledAnalysisService
             from .settings_service import SettingsService
             from .thought_service import ThoughtService
-            from .claude_service import ClaudeService
+            from .claude_service import get_claude_service
             from .claude_analysis_service import ClaudeAnalysisService
             
             scheduled_service = ScheduledAnalysisService(db)
@@ -335,7 +335,7 @@ def run_consciousness_check_job(user_id: str):
                 return
             
             # Call Claude for analysis
-            claude = ClaudeService()
+            claude = get_claude_service()
             analysis_result = claude.consciousness_check(
                 thoughts, 
                 timeframe=f"last {len(thoughts)}"
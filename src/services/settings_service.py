@@ -203,33 +203,27 @@ class SettingsService:
         depth_value = settings.consciousness_check_depth_value
         min_thoughts = settings.consciousness_check_min_thoughts
         
-        config = AnalysisDepthConfig(depth_type=depth_type)
-        
         if depth_type == SettingsDepthType.SMART:
-            # Smart mode: max(last N days, min M thoughts)
-            config.since_date = utc_now() - timedelta(days=depth_value)
-            config.min_thoughts = min_thoughts
-            config.max_thoughts = None  # No max for smart mode
-            
-        elif depth_type == SettingsDepthType.LAST_N_THOUGHTS:
+            # Smart mode: max(last N days, min M thoughts), no max
+            return AnalysisDepthConfig(
+                depth_type=depth_type,
+                since_date=utc_now() - timedelta(days=depth_value),
+                min_thoughts=min_thoughts
+            )
+        
+        if depth_type == SettingsDepthType.LAST_N_THOUGHTS:
             # Exact count of thoughts
-            config.since_date = None
-            config.max_thoughts = depth_value
-            config.min_thoughts = None
-            
-        elif depth_type == SettingsDepthType.LAST_N_DAYS:
+            return AnalysisDepthConfig(depth_type=depth_type, max_thoughts=depth_value)
+        
+        if depth_type == SettingsDepthType.LAST_N_DAYS:
             # All thoughts from last N days
-            config.since_date = utc_now() - timedelta(days=depth_value)
-            config.max_thoughts = None
-            config.min_thoughts = None
-            
-        elif depth_type == SettingsDepthType.ALL_THOUGHTS:
-            # Everything (expensive!)
-            config.since_date = None
-            config.max_thoughts = None
-            config.min_thoughts = None
+            return AnalysisDepthConfig(
+                depth_type=depth_type,
+                since_date=utc_now() - timedelta(days=depth_value)
+            )
         
-        return config
+        # ALL_THOUGHTS: everything (expensive!)
+        return AnalysisDepthConfig(depth_type=depth_type)
     
     def _create_default_settings(self, user_id: str) -> UserSettingsDB:
         """
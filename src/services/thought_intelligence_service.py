@@ -191,7 +191,7 @@ class ThoughtIntelligenceService:
         """
         try:
             # Use Claude directly for thought analysis
-            from src.services.claude_service import ClaudeService
+            from src.services.claude_service import get_claude_service
             import os
             
             api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -199,7 +199,7 @@ class ThoughtIntelligenceService:
                 logger.warning("No ANTHROPIC_API_KEY - cannot run thought analysis")
                 return None
             
-            claude = ClaudeService(api_key=api_key)
+            claude = get_claude_service(api_key)
             
             system_prompt = """You are analyzing a thought for the Personal AI Assistant.
 Respond ONLY with valid JSON, no other text."""
@@ -11,7 +11,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from sqlalchemy import or_, and_, func
+from sqlalchemy import or_, and_, func, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -172,11 +173,18 @@ class ThoughtService:
             # Apply tag filter if provided (OR logic)
             if tags:
                 # Check if any provided tag is in the thought's tags
-                # SQLite doesn't have json_contains, so we use json_extract with LIKE
-                tag_filters = [
-                    func.json_extract(ThoughtDB.tags, '$').like(f'%"{tag}"%')
-                    for tag in tags
-                ]
+                if self.db.get_bind().dialect.name == 'postgresql':
+                    # JSONB containment, served by idx_thoughts_tags_gin
+                    tag_filters = [
+                        ThoughtDB.tags.op('@>')(type_coerce([tag], JSONB))
+                        for tag in tags
+                    ]
+                else:
+                    # SQLite doesn't have json_contains, so we use json_extract with LIKE
+                    tag_filters = [
+                        func.json_extract(ThoughtDB.tags, '$').like(f'%"{tag}"%')
+                        for tag in tags
+                    ]
                 query = query.filter(or_(*tag_filters))
             
             # Get total count before pagination
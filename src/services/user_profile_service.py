@@ -181,10 +181,7 @@ class UserProfileService:
         
         merged = list(existing_themes | new_patterns)
         # Keep most recent/relevant - limit to 10
-        profile.common_themes = merged[-10:]
-        
-        profile.last_analysis_update = datetime.now(timezone.utc)
-        profile.updated_at = datetime.now(timezone.utc)
+        profile.apply_analysis({"common_themes": merged[-10:]})
         
         self.db.commit()
         self.db.refresh(profile)
@@ -315,13 +312,10 @@ class UserProfileService:
         """
         profile = await self.get_profile(user_id)
         
-        # Merge with existing patterns
-        existing = profile.thought_patterns or {}
-        existing.update(patterns)
-        
-        profile.thought_patterns = existing
-        profile.last_analysis_update = datetime.now(timezone.utc)
-        profile.updated_at = datetime.now(timezone.utc)
+        # Merge into a new dict so the change is detected and written
+        profile.apply_analysis({
+            "thought_patterns": {**(profile.thought_patterns or {}), **patterns}
+        })
         
         self.db.commit()
         self.db.refresh(profile)
@@ -20,6 +20,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from src.api.main import app
+from src.database.json_codec import json_dumps, json_loads
 from src.database.session import get_db
 from src.models.base import Base, utc_now
 from src.models.enums import ThoughtStatus, TaskStatus, Priority
@@ -56,6 +57,8 @@ def test_engine():
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,  # Keep in-memory DB alive across connections
         echo=False,  # Set to True for SQL debugging
+        json_serializer=json_dumps,  # Same JSON codec as the app engine
+        json_deserializer=json_loads,
     )
     
     # Enable foreign key constraints for SQLite
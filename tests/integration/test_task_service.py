@@ -9,6 +9,8 @@ import pytest
 from datetime import date, datetime, timezone, timedelta
 from uuid import uuid4
 
+from sqlalchemy.exc import IntegrityError
+
 from src.services import TaskService, NotFoundError, UnauthorizedError
 from src.models.task import TaskDB
 from src.models.thought import ThoughtDB
@@ -372,6 +374,19 @@ class TestTaskServiceIntegration:
         task_ids = [t.id for t in tasks]
         assert task1.id in task_ids
         assert task2.id in task_ids
+    
+    def test_invalid_priority_rejected_by_database(self, db_session, sample_user):
+        """Test the CHECK constraint rejects priorities outside the enum."""
+        db_session.add(TaskDB(
+            id=str(uuid4()),
+            user_id=str(sample_user.id),
+            title="Bad priority",
+            priority="urgent"
+        ))
+        
+        with pytest.raises(IntegrityError):
+            db_session.commit()
+        db_session.rollback()
 
 
 # Additional fixtures
@@ -0,0 +1,30 @@
+"""
+Integration tests for UserProfileService.
+
+Tests analysis updates against a real in-memory SQLite database.
+"""
+
+import pytest
+from uuid import UUID
+
+from src.services.user_profile_service import UserProfileService
+from src.models.user_profile import UserProfileDB
+
+
+@pytest.mark.integration
+class TestUserProfileServiceIntegration:
+    """Integration tests for UserProfileService using real database."""
+    
+    @pytest.mark.asyncio
+    async def test_update_thought_patterns_merges_and_persists(self, db_session, sample_user):
+        """Test repeated pattern updates are merged and written to the database."""
+        service = UserProfileService(db_session)
+        user_id = UUID(str(sample_user.id))
+        
+        await service.update_thought_patterns(user_id, {"peak_hours": [9]})
+        profile = await service.update_thought_patterns(user_id, {"triggers": ["email"]})
+        
+        db_session.expire_all()
+        stored = db_session.get(UserProfileDB, profile.id)
+        assert stored.thought_patterns == {"peak_hours": [9], "triggers": ["email"]}
+        assert stored.last_analysis_update == stored.updated_at
@@ -309,6 +309,45 @@ class TestTaskUpdate:
             TaskUpdate(title="a" * 201)  # Too long
 
 
+# ============================================================================
+# User Model Tests
+# ============================================================================
+
+class TestUserEmail:
+    """Test email validation shared by UserCreate and UserUpdate."""
+    
+    def test_email_is_normalized(self):
+        """Test email is stripped and lowercased."""
+        from src.models.user import UserCreate, UserUpdate
+        
+        assert UserCreate(name="Andy", email=" Andy@Example.COM ").email == "andy@example.com"
+        assert UserUpdate(email="Andy@Example.com").email == "andy@example.com"
+    
+    @pytest.mark.parametrize("email", ["andy@example", "@example.com", "an dy@example.com", "a@b@c.com"])
+    def test_invalid_email_rejected(self, email):
+        """Test malformed addresses fail on both create and update."""
+        from src.models.user import UserCreate, UserUpdate
+        
+        with pytest.raises(ValidationError) as exc_info:
+            UserCreate(name="Andy", email=email)
+        assert "Invalid email format" in str(exc_info.value)
+        
+        with pytest.raises(ValidationError):
+            UserUpdate(email=email)
+
+
+class TestUserProfileInterests:
+    """Test interest normalization on profile create and update."""
+    
+    def test_interests_deduplicated_in_order(self):
+        """Test interests are lowercased and deduplicated, keeping order."""
+        from src.models.user_profile import UserProfileCreate, UserProfileUpdate
+        
+        raw = ["Rust", " python ", "rust", "", "Go"]
+        assert UserProfileCreate(interests=raw).interests == ["rust", "python", "go"]
+        assert UserProfileUpdate(interests=raw).interests == ["rust", "python", "go"]
+
+
 # ============================================================================
 # Enum Tests
 # ============================================================================
@@ -363,6 +402,14 @@ class TestEnums:
     def test_enum_string_conversion(self):
         """Enums convert to strings correctly."""
         assert str(Priority.HIGH.value) == "high"
+    
+    def test_enums_are_single_shared_classes(self):
+        """Package re-exports and lookups return the same enum objects."""
+        import src.models as models
+        
+        assert models.TimeOfDay is TimeOfDay
+        assert models.Priority is Priority
+        assert TimeOfDay("morning") is TimeOfDay.MORNING
 
 
 # ============================================================================
@@ -519,3 +566,161 @@ class TestEdgeCases:
         )
         assert thought.context["user"]["energy"] == "high"
         assert len(thought.context["environment"]["apps"]) == 2
+
+
+# ============================================================================
+# DB -> Response Conversion Tests
+# ============================================================================
+
+class TestToResponse:
+    """Test trusted DB row conversion matches validated construction."""
+    
+    def test_context_to_response_matches_validated_model(self):
+        """ContextDB.to_response() equals a fully validated ContextResponse."""
+        from uuid import uuid4
+        from src.models.base import utc_now
+        from src.models.context import ContextDB, ContextResponse
+        
+        row = ContextDB(
+            id="session-1",
+            user_id=str(uuid4()),
+            started_at=utc_now(),
+            time_of_day=TimeOfDay.MORNING.value,
+            thought_count=2
+        )
+        
+        response = row.to_response()
+        
+        assert isinstance(response.user_id, UUID)
+        assert response.time_of_day == "morning"
+        assert response == ContextResponse.model_validate(response.model_dump())
+    
+    def test_scheduled_analysis_to_response_matches_validated_model(self):
+        """ScheduledAnalysisDB.to_response() equals a validated response."""
+        from uuid import uuid4
+        from src.models.base import utc_now
+        from src.models.scheduled_analysis import (
+            ScheduledAnalysisDB,
+            ScheduledAnalysisResponse,
+        )
+        
+        now = utc_now()
+        row = ScheduledAnalysisDB(
+            id=str(uuid4()),
+            user_id=str(uuid4()),
+            scheduled_at=now,
+            status="completed",
+            triggered_by="scheduler",
+            created_at=now
+        )
+        
+        response = row.to_response()
+        
+        assert isinstance(response.id, UUID)
+        assert response.status == "completed"
+        assert response.updated_at == now
+        assert response == ScheduledAnalysisResponse.model_validate(
+            response.model_dump()
+        )
+    
+    def test_scheduled_analysis_to_responses_preserves_order(self):
+        """ScheduledAnalysisDB.to_responses() converts rows in order."""
+        from uuid import uuid4
+        from src.models.base import utc_now
+        from src.models.scheduled_analysis import ScheduledAnalysisDB
+        
+        user_id = str(uuid4())
+        rows = [
+            ScheduledAnalysisDB(
+                id=str(uuid4()),
+                user_id=user_id,
+                scheduled_at=utc_now(),
+                status=status,
+                triggered_by="scheduler",
+                created_at=utc_now()
+            )
+            for status in ("pending", "running", "failed")
+        ]
+        
+        responses = ScheduledAnalysisDB.to_responses(rows)
+        
+        assert [str(r.id) for r in responses] == [row.id for row in rows]
+        assert [r.status for r in responses] == ["pending", "running", "failed"]
+        assert responses[0] == rows[0].to_response()
+    
+    def test_task_to_response_matches_validated_model(self):
+        """TaskDB.to_response() keeps enum types and equals a validated model."""
+        from uuid import uuid4
+        from src.models.base import utc_now
+        from src.models.task import TaskDB
+        
+        row = TaskDB(
+            id=str(uuid4()),
+            user_id=str(uuid4()),
+            title="Write tests",
+            priority=Priority.HIGH.value,
+            status=TaskStatus.PENDING.value,
+            linked_reminders=None,
+            subtasks=None,
+            created_at=utc_now(),
+            updated_at=utc_now()
+        )
+        
+        response = row.to_response()
+        
+        assert response.priority is Priority.HIGH
+        assert response.source_thought_id is None
+        assert response.linked_reminders == []
+        assert response == TaskResponse.model_validate(response.model_dump())
+    
+    def test_thought_to_response_matches_validated_model(self):
+        """ThoughtDB.to_response() coerces UUID lists and optional enums."""
+        from uuid import uuid4
+        from src.models.base import utc_now
+        from src.models.enums import ThoughtType
+        from src.models.thought import ThoughtDB
+        
+        related_id = str(uuid4())
+        row = ThoughtDB(
+            id=str(uuid4()),
+            user_id=str(uuid4()),
+            content="Call the dentist",
+            tags=["health"],
+            status=ThoughtStatus.ACTIVE.value,
+            related_thought_ids=[related_id],
+            thought_type=ThoughtType.TASK.value,
+            emotional_tone=None,
+            created_at=utc_now(),
+            updated_at=utc_now()
+        )
+        
+        response = row.to_response()
+        
+        assert response.related_thought_ids == [UUID(related_id)]
+        assert response.thought_type is ThoughtType.TASK
+        assert response.emotional_tone is None
+        assert response == ThoughtResponse.model_validate(response.model_dump())
+    
+    def test_user_to_response_matches_validated_model(self):
+        """UserDB.to_response() returns the role as a UserRole member."""
+        from uuid import uuid4
+        from src.models.base import utc_now
+        from src.models.enums import UserRole
+        from src.models.user import UserDB, UserResponse
+        
+        row = UserDB(
+            id=str(uuid4()),
+            name="Test User",
+            email="test@example.com",
+            preferences=None,
+            is_active=True,
+            role="admin",
+            created_at=utc_now(),
+            updated_at=utc_now()
+        )
+        
+        response = row.to_response()
+        
+        assert response.role is UserRole.ADMIN
+        assert response.preferences == {}
+        assert response == UserResponse.model_validate(response.model_dump())
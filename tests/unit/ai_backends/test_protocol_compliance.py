@@ -5,12 +5,20 @@ Ensures all backend implementations satisfy the AIBackend protocol
 with identical behavior guarantees (idempotency, timeouts, validation).
 """
 
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlsplit
+
+import httpx
 import pytest
+import pytest_asyncio
+from anthropic import Anthropic
 
 from src.services.ai_backends.models import BackendRequest
 from src.services.ai_backends.base import validate_backend
 from src.services.ai_backends.claude_backend import ClaudeBackend
 from src.services.ai_backends.ollama_backend import OllamaBackend
+from src.services.ai_backends.openai_compatible_backend import OpenAICompatibleBackend
 from src.services.ai_backends.mock_backend import MockBackend
 
 
@@ -279,3 +287,224 @@ class TestValidation:
         response = await mock_backend.analyze(request)
         
         assert response is not None
+
+
+class TestClaudeBackendIdempotency:
+    """Test ClaudeBackend returns stored results for repeated request_ids"""
+    
+    @pytest.fixture
+    def claude_backend(self, monkeypatch):
+        """ClaudeBackend whose SDK call is replaced with a call counter"""
+        backend = ClaudeBackend(api_key="sk-test-idempotency")
+        calls = []
+        
+        def fake_analyze(request):
+            calls.append(request.request_id)
+            return {"summary": f"analysis {len(calls)}", "tokens_used": 10}
+        
+        monkeypatch.setattr(backend, "_analyze_sync", fake_analyze)
+        backend.calls = calls
+        return backend
+    
+    @pytest.mark.asyncio
+    async def test_same_request_id_and_content_reuses_result(self, claude_backend):
+        """repeating a request does not call the API again"""
+        request = BackendRequest(request_id="req-same", thought_content="test")
+        
+        first = await claude_backend.analyze(request)
+        second = await claude_backend.analyze(request)
+        
+        assert first.success is True
+        assert second is first
+        assert claude_backend.calls == ["req-same"]
+    
+    @pytest.mark.asyncio
+    async def test_changed_content_is_reanalyzed(self, claude_backend):
+        """same request_id with new content calls the API again"""
+        await claude_backend.analyze(
+            BackendRequest(request_id="req-edit", thought_content="before")
+        )
+        response = await claude_backend.analyze(
+            BackendRequest(request_id="req-edit", thought_content="after")
+        )
+        
+        assert response.analysis.summary == "analysis 2"
+        assert claude_backend.calls == ["req-edit", "req-edit"]
+
+
+class TestClaudeBackendHealthCheck:
+    """Test ClaudeBackend caches its health probe"""
+    
+    @pytest.fixture
+    def claude_backend(self, monkeypatch):
+        """ClaudeBackend whose probe is replaced with a call counter"""
+        backend = ClaudeBackend(api_key="sk-test-health")
+        backend.probes = 0
+        backend.probe_fails = False
+        
+        def fake_probe():
+            backend.probes += 1
+            if backend.probe_fails:
+                raise ConnectionError("unreachable")
+        
+        monkeypatch.setattr(backend, "_probe_sync", fake_probe)
+        return backend
+    
+    @pytest.mark.asyncio
+    async def test_result_is_cached(self, claude_backend):
+        """repeated checks within the TTL probe the API once"""
+        assert await claude_backend.health_check() is True
+        assert await claude_backend.health_check() is True
+        assert claude_backend.probes == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_probe_reports_unhealthy(self, claude_backend):
+        """an unreachable API is reported and re-probed after expiry"""
+        claude_backend.probe_fails = True
+        assert await claude_backend.health_check() is False
+        
+        claude_backend.probe_fails = False
+        claude_backend._health_cache_expiry = 0.0
+        assert await claude_backend.health_check() is True
+        assert claude_backend.probes == 2
+
+
+class TestClaudeBackendHealthProbe:
+    """Test the health probe against the real Anthropic client"""
+    
+    @pytest.fixture
+    def probe_backend(self, monkeypatch):
+        """ClaudeBackend whose SDK client talks to a local HTTP server"""
+        backend = ClaudeBackend(api_key="sk-test-probe")
+        backend.status = 200
+        backend.paths = []
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                backend.paths.append(urlsplit(self.path).path)
+                body = b'{"data": [], "has_more": false, "first_id": null, "last_id": null}'
+                self.send_response(backend.status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        
+        client = Anthropic(
+            api_key="sk-test-probe",
+            base_url=f"http://127.0.0.1:{server.server_port}"
+        )
+        # The ClaudeService is shared through get_claude_service's cache,
+        # so patch its client rather than replacing it outright
+        monkeypatch.setattr(backend._claude, "client", client)
+        yield backend
+        client.close()
+        server.shutdown()
+        server.server_close()
+    
+    @pytest.mark.asyncio
+    async def test_probe_uses_models_endpoint(self, probe_backend):
+        """the installed SDK supports the probe and reports healthy"""
+        assert await probe_backend.health_check() is True
+        assert probe_backend.paths == ["/v1/models"]
+    
+    @pytest.mark.asyncio
+    async def test_server_error_reports_unhealthy(self, probe_backend):
+        """an API error is reported once, without SDK retries"""
+        probe_backend.status = 503
+        assert await probe_backend.health_check() is False
+        assert probe_backend.paths == ["/v1/models"]
+
+
+class TestOllamaBackendClient:
+    """Test OllamaBackend reuses one pooled HTTP client"""
+    
+    @pytest_asyncio.fixture
+    async def ollama_backend(self):
+        """OllamaBackend on a mock transport; status and paths are settable"""
+        seen = []
+        status = {"code": 200}
+        
+        def handler(request):
+            seen.append(request.url.path)
+            return httpx.Response(status["code"], json={"models": []})
+        
+        backend = OllamaBackend(
+            base_url="http://ollama.test",
+            transport=httpx.MockTransport(handler)
+        )
+        backend.seen = seen
+        backend.status = status
+        yield backend
+        await backend.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_calls_share_client_until_closed(self, ollama_backend):
+        """health checks go through the same client, closed by aclose"""
+        assert await ollama_backend.health_check() is True
+        assert await ollama_backend.health_check() is True
+        assert ollama_backend.seen == ["/api/tags", "/api/tags"]
+        
+        await ollama_backend.aclose()
+        assert ollama_backend._client.is_closed
+    
+    def test_parse_response_ignores_prose_braces(self, ollama_backend):
+        """JSON is found even with braces in the surrounding text"""
+        text = 'Use {curly} style.\n{"summary": "s {x}", "themes": []}\nSee {docs}.'
+        
+        parsed = ollama_backend._parse_response({"message": {"content": text}})
+        
+        assert parsed == {"summary": "s {x}", "themes": []}
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,error_code", [
+        (429, "RATE_LIMITED"),
+        (503, "UNAVAILABLE"),
+        (404, "MALFORMED_RESPONSE"),
+    ])
+    async def test_http_errors_are_classified(self, ollama_backend, status, error_code):
+        """non-2xx chat responses map to specific error codes"""
+        ollama_backend.status["code"] = status
+        
+        response = await ollama_backend.analyze(
+            BackendRequest(request_id="req-http", thought_content="test")
+        )
+        
+        assert response.success is False
+        assert response.error.error_code == error_code
+
+
+class TestOpenAICompatibleBackendClient:
+    """Test OpenAICompatibleBackend reuses one pooled HTTP client"""
+    
+    @pytest_asyncio.fixture
+    async def openai_backend(self):
+        """OpenAICompatibleBackend on a mock transport recording request URLs"""
+        seen = []
+        
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, json={"data": []})
+        
+        backend = OpenAICompatibleBackend(
+            base_url="http://llm.test/v1",
+            transport=httpx.MockTransport(handler)
+        )
+        backend.seen = seen
+        yield backend
+        await backend.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_requests_resolve_under_base_path(self, openai_backend):
+        """relative paths keep the /v1 prefix of base_url"""
+        assert await openai_backend.health_check() is True
+        assert openai_backend.seen == ["http://llm.test/v1/models"]
+        
+        await openai_backend.aclose()
+        assert openai_backend._client.is_closed
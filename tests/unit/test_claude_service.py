@@ -0,0 +1,31 @@
+"""
+Tests for shared ClaudeService instances.
+
+Verifies get_claude_service() reuses one client per API key instead of
+constructing a new Anthropic client per request.
+"""
+
+import pytest
+
+from src.services.claude_service import get_claude_service
+
+
+class TestGetClaudeService:
+    """Test the shared ClaudeService factory"""
+    
+    def test_same_key_returns_same_instance(self):
+        """Repeated lookups with one key share a service"""
+        assert get_claude_service("sk-test-a") is get_claude_service("sk-test-a")
+    
+    def test_env_key_is_used_when_not_provided(self, monkeypatch):
+        """Falls back to ANTHROPIC_API_KEY like ClaudeService()"""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-env")
+        
+        assert get_claude_service() is get_claude_service("sk-test-env")
+    
+    def test_missing_key_raises(self, monkeypatch):
+        """No key provided or configured raises ValueError"""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        
+        with pytest.raises(ValueError):
+            get_claude_service()
@@ -0,0 +1,32 @@
+"""
+Tests for the database JSON codec.
+
+Verifies the orjson-backed serializer stays compatible with what the
+stdlib json module would have stored in JSON columns.
+"""
+
+import json
+
+from src.database.json_codec import json_dumps, json_loads
+
+
+class TestJsonCodec:
+    """Test JSON column serialization helpers"""
+    
+    def test_dumps_returns_str(self):
+        """Serializer returns text, as DBAPI drivers expect"""
+        assert isinstance(json_dumps({"a": 1}), str)
+    
+    def test_round_trip_matches_stdlib(self):
+        """Values decode identically to stdlib json output"""
+        value = {
+            "tags": ["work", "ideas"],
+            "nested": {"count": 3, "ratio": 0.5, "flag": True, "none": None},
+            "unicode": "café ☕",
+        }
+        
+        assert json_loads(json_dumps(value)) == json.loads(json.dumps(value))
+    
+    def test_non_string_keys_are_coerced(self):
+        """Integer keys become strings, matching stdlib json"""
+        assert json_loads(json_dumps({1: "a"})) == {"1": "a"}